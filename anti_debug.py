@@ -6,8 +6,36 @@ Anti-debugging and anti-VM detection module for Tele Browser
 import os
 import sys
 import time
-import psutil
-import platform
+
+IS_LINUX = sys.platform.startswith('linux')
+
+
+def process_names():
+    """
+    Lower-case names of all running processes. Read straight from /proc on
+    Linux; psutil is only imported on other platforms, on first use.
+    """
+    if IS_LINUX:
+        names = []
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open('/proc/{}/comm'.format(entry)) as f:
+                    names.append(f.read().strip().lower())
+            except OSError:
+                continue
+        return names
+
+    import psutil
+    names = []
+    for proc in psutil.process_iter(['name']):
+        try:
+            names.append((proc.info['name'] or '').lower())
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return names
+
 
 def check_debugger():
     """
@@ -21,17 +49,13 @@ def check_debugger():
             'ida', 'ida64', 'x64dbg', 'ollydbg', 'windbg'
         ]
         
-        for proc in psutil.process_iter(['name']):
-            try:
-                proc_name = proc.info['name'].lower()
-                if any(dbg in proc_name for dbg in debugger_processes):
-                    print("Debugger detected! Exiting for security.", file=sys.stderr)
-                    sys.exit(1)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+        for proc_name in process_names():
+            if any(dbg in proc_name for dbg in debugger_processes):
+                print("Debugger detected! Exiting for security.", file=sys.stderr)
+                sys.exit(1)
         
         # Check for ptrace (Linux-specific)
-        if platform.system() == 'Linux':
+        if IS_LINUX:
             try:
                 with open('/proc/self/status', 'r') as f:
                     for line in f:
@@ -66,7 +90,7 @@ def check_vm():
         vm_indicators = []
         
         # Check CPU info for VM indicators (Linux)
-        if platform.system() == 'Linux':
+        if IS_LINUX:
             try:
                 with open('/proc/cpuinfo', 'r') as f:
                     cpuinfo = f.read().lower()
@@ -99,7 +123,7 @@ def check_vm():
             pass
         
         # Check for VM-specific devices
-        if platform.system() == 'Linux':
+        if IS_LINUX:
             try:
                 with open('/proc/scsi/scsi', 'r') as f:
                     scsi_info = f.read().lower()
@@ -110,9 +134,15 @@ def check_vm():
         
         # Check MAC address for VM vendors
         try:
-            import re
-            if platform.system() == 'Linux':
-                result = os.popen('cat /sys/class/net/*/address 2>/dev/null').read()
+            if IS_LINUX:
+                # Read the files directly rather than forking a shell and cat
+                result = ''
+                for iface in os.listdir('/sys/class/net'):
+                    try:
+                        with open('/sys/class/net/{}/address'.format(iface)) as f:
+                            result += f.read()
+                    except OSError:
+                        pass
                 vm_mac_prefixes = [
                     '00:05:69', '00:0c:29', '00:1c:14', '00:50:56',  # VMware
                     '08:00:27',  # VirtualBox
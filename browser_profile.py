@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent web profile and HTTP cache management for Tele Browser
+"""
+
+import os
+import sys
+from PyQt5.QtCore import QObject, QStandardPaths, QUrl
+from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineProfile
+
+PROFILE_NAME = 'TeleBrowser'
+
+# Cache settings can be overridden per deployment through the environment
+CACHE_SIZE_MB = int(os.environ.get('TELEBROWSER_CACHE_MB', '512'))
+CACHE_PATH = os.environ.get('TELEBROWSER_CACHE_PATH', '')
+WARM_URLS = [u for u in os.environ.get('TELEBROWSER_WARM_URLS', '').split(',') if u.strip()]
+
+# Collects Resource Timing entries of the current document. A transferSize of
+# 0 with a non-zero body size means the response was served from the cache.
+CACHE_STATS_SCRIPT = """
+(function() {
+    var entries = performance.getEntriesByType('navigation')
+        .concat(performance.getEntriesByType('resource'));
+    var stats = {hits: 0, misses: 0, savedBytes: 0, transferredBytes: 0};
+    entries.forEach(function(e) {
+        if (!e.decodedBodySize) {
+            return;
+        }
+        if (e.transferSize === 0) {
+            stats.hits += 1;
+            stats.savedBytes += e.encodedBodySize;
+        } else {
+            stats.misses += 1;
+            stats.transferredBytes += e.transferSize;
+        }
+    });
+    return stats;
+})();
+"""
+
+
+class CacheStats:
+    """Accumulates HTTP cache hit/miss counters reported by loaded pages"""
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.saved_bytes = 0
+        self.transferred_bytes = 0
+
+    def record(self, stats):
+        """Add the result of CACHE_STATS_SCRIPT for one page load"""
+        if not stats:
+            return
+        self.hits += int(stats.get('hits', 0))
+        self.misses += int(stats.get('misses', 0))
+        self.saved_bytes += int(stats.get('savedBytes', 0))
+        self.transferred_bytes += int(stats.get('transferredBytes', 0))
+
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def summary(self):
+        """One-line summary suitable for fleet log collection"""
+        return 'cache hits={} misses={} ratio={:.1%} saved={:.1f}MB transferred={:.1f}MB'.format(
+            self.hits, self.misses, self.hit_ratio(),
+            self.saved_bytes / (1024 * 1024), self.transferred_bytes / (1024 * 1024))
+
+
+cache_stats = CacheStats()
+
+
+def report_cache_usage(page):
+    """Sample cache usage of a page after it finished loading"""
+    page.runJavaScript(CACHE_STATS_SCRIPT, cache_stats.record)
+
+
+def create_profile(parent=None):
+    """
+    Create the named, disk-backed profile shared by all tabs.
+    Cookies and the HTTP cache survive restarts so the heavy exam
+    bundles are only fetched once per machine.
+    """
+    profile = QWebEngineProfile(PROFILE_NAME, parent)
+
+    storage_root = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+    cache_root = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+    storage_path = os.path.join(storage_root, PROFILE_NAME)
+    cache_path = CACHE_PATH or os.path.join(cache_root, PROFILE_NAME)
+
+    for path in (storage_path, cache_path):
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+    profile.setPersistentStoragePath(storage_path)
+    profile.setCachePath(cache_path)
+    profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+    profile.setHttpCacheMaximumSize(CACHE_SIZE_MB * 1024 * 1024)
+    profile.setPersistentCookiesPolicy(QWebEngineProfile.ForcePersistentCookies)
+
+    print("Profile: {} cache={} ({} MB)".format(storage_path, cache_path, CACHE_SIZE_MB))
+    return profile
+
+
+class CacheWarmer(QObject):
+    """Loads a list of URLs in hidden pages to populate the disk cache"""
+    def __init__(self, profile, urls, parent=None):
+        super().__init__(parent)
+        self.profile = profile
+        self.pending = list(urls)
+        self.page = None
+
+    def start(self):
+        self.load_next()
+
+    def load_next(self):
+        if self.page is not None:
+            self.page.deleteLater()
+            self.page = None
+
+        if not self.pending:
+            return
+
+        url = self.pending.pop(0).strip()
+        self.page = QWebEnginePage(self.profile, self)
+        self.page.loadFinished.connect(self.on_load_finished)
+        self.page.setUrl(QUrl(url))
+
+    def on_load_finished(self, ok):
+        if not ok:
+            print("Cache warm failed: {}".format(self.page.url().toString()), file=sys.stderr)
+        self.load_next()
+
+
+def warm_cache(profile, urls=None, parent=None):
+    """Start warming the cache with the configured URLs, if any"""
+    urls = WARM_URLS if urls is None else urls
+    if not urls:
+        return None
+    warmer = CacheWarmer(profile, urls, parent)
+    warmer.start()
+    return warmer
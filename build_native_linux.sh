@@ -4,6 +4,12 @@ echo "Tele Browser Build System (Native Linux)"
 echo "========================================"
 echo ""
 
+# BUILD_MODE=cached (default): --onedir bundle wrapped in launcher.sh,
+# extracted once into a hash-keyed cache and reused on later starts.
+# BUILD_MODE=onefile: the old single self-extracting executable, which
+# unpacks the whole payload to a temp dir on every launch.
+BUILD_MODE="${BUILD_MODE:-cached}"
+
 # Colors
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -60,7 +66,7 @@ fi
 echo -e "${GREEN}Obfuscation complete!${NC}"
 
 # Step 4: Build with PyInstaller
-echo -e "${YELLOW}Step 4: Building executable with PyInstaller...${NC}"
+echo -e "${YELLOW}Step 4: Building executable with PyInstaller (${BUILD_MODE})...${NC}"
 
 cd obfuscated
 
@@ -73,8 +79,26 @@ for pyfile in *.py; do
     fi
 done
 
+if [ "$BUILD_MODE" = "onefile" ]; then
+    PACKAGE_ARGS="--onefile --collect-all PyQt5"
+else
+    # Only the Qt modules the browser imports; PyInstaller's PyQt5 hooks
+    # pull in their shared libraries, QtWebEngineProcess and resources.
+    # Everything else that --collect-all used to drag in is left out.
+    PACKAGE_ARGS="--onedir --noupx"
+    for module in QtBluetooth QtDBus QtDesigner QtHelp QtLocation QtMultimedia \
+                  QtMultimediaWidgets QtNfc QtOpenGL QtPositioning QtQml QtQuick \
+                  QtQuickWidgets QtRemoteObjects QtSensors QtSerialPort QtSql \
+                  QtSvg QtTest QtTextToSpeech QtWebSockets QtXml QtXmlPatterns \
+                  QtWebEngine Qt3DCore Qt3DRender Qt3DInput Qt3DLogic Qt3DAnimation \
+                  Qt3DExtras; do
+        PACKAGE_ARGS="$PACKAGE_ARGS --exclude-module=PyQt5.$module"
+    done
+    PACKAGE_ARGS="$PACKAGE_ARGS --exclude-module=tkinter"
+fi
+
 pyinstaller \
-    --onefile \
+    $PACKAGE_ARGS \
     --windowed \
     --name TeleBrowser \
     --hidden-import=PyQt5 \
@@ -90,7 +114,6 @@ pyinstaller \
     --hidden-import=threading \
     --hidden-import=subprocess \
     $HIDDEN_IMPORTS \
-    --collect-all PyQt5 \
     --copy-metadata psutil \
     secure_browser.py
 
@@ -104,33 +127,101 @@ cd ..
 
 echo -e "${GREEN}Build complete!${NC}"
 
-# Step 5: Compress with UPX (optional)
-echo -e "${YELLOW}Step 5: Compressing with UPX...${NC}"
-if command -v upx &> /dev/null; then
-    upx --best obfuscated/dist/TeleBrowser 2>/dev/null
-    if [ $? -eq 0 ]; then
-        echo -e "${GREEN}UPX compression successful${NC}"
+if [ "$BUILD_MODE" = "onefile" ]; then
+    # Step 5: Compress with UPX (optional)
+    echo -e "${YELLOW}Step 5: Compressing with UPX...${NC}"
+    if command -v upx &> /dev/null; then
+        upx --best obfuscated/dist/TeleBrowser 2>/dev/null
+        if [ $? -eq 0 ]; then
+            echo -e "${GREEN}UPX compression successful${NC}"
+        else
+            echo -e "${YELLOW}UPX compression skipped${NC}"
+        fi
     else
-        echo -e "${YELLOW}UPX compression skipped${NC}"
+        echo -e "${YELLOW}UPX not installed, skipping compression${NC}"
+        echo "Install with: sudo apt install upx-ucl"
     fi
+
+    # Step 6: Copy to output
+    echo -e "${YELLOW}Step 6: Organizing output...${NC}"
+    cp obfuscated/dist/TeleBrowser installer_output/
+    chmod +x installer_output/TeleBrowser
 else
-    echo -e "${YELLOW}UPX not installed, skipping compression${NC}"
-    echo "Install with: sudo apt install upx-ucl"
+    # Step 5: Pack the bundle behind the caching launcher. UPX is skipped:
+    # the cache is unpacked once, and compressed libraries would have to be
+    # decompressed in memory on every start instead.
+    echo -e "${YELLOW}Step 5: Packing bundle behind the fast-start launcher...${NC}"
+    tar -czf obfuscated/payload.tar.gz -C obfuscated/dist/TeleBrowser .
+    PAYLOAD_SHA256=$(sha256sum obfuscated/payload.tar.gz | cut -d' ' -f1)
+
+    # Checksums of the startup-critical files, checked by the launcher on
+    # every start; paths are relative to the extracted bundle
+    (cd obfuscated/dist/TeleBrowser && find . -type f \( -name TeleBrowser -o -name '*.pyz' \
+        -o -name base_library.zip -o -name 'libpython*.so*' \) -printf '%P\n' | LC_ALL=C sort | \
+        xargs -d '\n' sha256sum) > obfuscated/critical.sha256
+
+    # Step 6: Copy to output
+    echo -e "${YELLOW}Step 6: Organizing output...${NC}"
+    sed "s/@PAYLOAD_SHA256@/$PAYLOAD_SHA256/" launcher.sh | \
+        awk -v sums=obfuscated/critical.sha256 \
+            '$0 == "@CRITICAL_SUMS@" { while ((getline line < sums) > 0) print line; next } { print }' \
+        > installer_output/TeleBrowser
+    echo "__PAYLOAD_BELOW__" >> installer_output/TeleBrowser
+    cat obfuscated/payload.tar.gz >> installer_output/TeleBrowser
+    chmod +x installer_output/TeleBrowser
+
+    # Step 7: Measure real cold (first extraction) and warm (cache reuse)
+    # starts: the browser runs offscreen against a local page and writes its
+    # startup trace, whose clock starts when the launcher process is created
+    echo -e "${YELLOW}Step 7: Measuring start times...${NC}"
+    BENCH_DIR=$(mktemp -d)
+    measure_start() {
+        local trace="$BENCH_DIR/trace-$1.json" pid
+        TELEBROWSER_CACHE_ROOT="$BENCH_DIR/cache" \
+        XDG_DATA_HOME="$BENCH_DIR/data" XDG_CONFIG_HOME="$BENCH_DIR/config" XDG_CACHE_HOME="$BENCH_DIR/xdg-cache" \
+        TELEBROWSER_STARTUP_TRACE="$trace" TELEBROWSER_SINGLE_INSTANCE=0 \
+        TELEBROWSER_HOME_URL='data:text/html,<title>start</title>' QT_QPA_PLATFORM=offscreen \
+            ./installer_output/TeleBrowser > /dev/null 2>&1 &
+        pid=$!
+        for _ in $(seq 600); do
+            [ -s "$trace" ] && break
+            kill -0 "$pid" 2> /dev/null || break
+            sleep 0.1
+        done
+        sleep 0.5
+        kill "$pid" 2> /dev/null
+        wait "$pid" 2> /dev/null
+        python3 - "$trace" <<'EOF'
+import json, sys
+try:
+    with open(sys.argv[1]) as f:
+        events = json.load(f)['traceEvents']
+except (OSError, ValueError, KeyError):
+    print('n/a n/a')
+    sys.exit()
+marks = {e['name']: '{:.0f}'.format(e['ts'] / 1000) for e in events if e['ph'] == 'i'}
+print(marks.get('first pixel', 'n/a'), marks.get('home loaded', 'n/a'))
+EOF
+    }
+    read COLD_PIXEL_MS COLD_HOME_MS <<< "$(measure_start cold)"
+    read WARM_PIXEL_MS WARM_HOME_MS <<< "$(measure_start warm)"
+    rm -rf "$BENCH_DIR"
+    echo "Cold start (extract + verify): first pixel ${COLD_PIXEL_MS} ms, home loaded ${COLD_HOME_MS} ms"
+    echo "Warm start (cache reuse):      first pixel ${WARM_PIXEL_MS} ms, home loaded ${WARM_HOME_MS} ms"
 fi
 
-# Step 6: Copy to output
-echo -e "${YELLOW}Step 6: Organizing output...${NC}"
-cp obfuscated/dist/TeleBrowser installer_output/
-chmod +x installer_output/TeleBrowser
-
 echo ""
 echo -e "${GREEN}========================================"
 echo "BUILD SUCCESSFUL!"
 echo "========================================${NC}"
 echo "Executable: installer_output/TeleBrowser"
+if [ "$BUILD_MODE" != "onefile" ]; then
+    echo "Payload:    $PAYLOAD_SHA256"
+    echo "Start:      cold ${COLD_PIXEL_MS}/${COLD_HOME_MS} ms, warm ${WARM_PIXEL_MS}/${WARM_HOME_MS} ms (first pixel/home loaded)"
+fi
 echo ""
 echo "To run: ./installer_output/TeleBrowser"
 echo ""
 echo "File size:"
 ls -lh installer_output/TeleBrowser
-echo ""
\ No newline at end of file
+echo ""
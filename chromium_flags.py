@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Chromium runtime flag profiles for QtWebEngine
+Must be applied before QApplication is created.
+"""
+
+import os
+import sys
+
+ENV_VAR = 'QTWEBENGINE_CHROMIUM_FLAGS'
+
+
+def positive_int(value):
+    return isinstance(value, int) and value > 0
+
+
+def switch(value):
+    return value is None
+
+
+# Flags this layer is allowed to manage, with a validator for the value
+KNOWN_FLAGS = {
+    'renderer-process-limit': positive_int,
+    'process-per-site': switch,
+    'single-process': switch,
+    'disable-gpu': switch,
+    'disable-gpu-compositing': switch,
+    'enable-software-rasterizer': switch,
+    'disk-cache-size': positive_int,
+    'js-flags': lambda value: isinstance(value, str) and value.startswith('--'),
+}
+
+# Flags that cannot be combined
+CONFLICTS = [
+    ('single-process', 'process-per-site'),
+    ('single-process', 'renderer-process-limit'),
+]
+
+FLAG_PROFILES = {
+    # Chromium defaults: process per site instance, GPU probing enabled
+    'default': {},
+    # Lab PCs without a usable GPU
+    'lab': {
+        'renderer-process-limit': 4,
+        'process-per-site': None,
+        'disable-gpu': None,
+        'disable-gpu-compositing': None,
+    },
+    # Weak machines: few renderers, software raster and a capped V8 heap
+    'low-resource': {
+        'renderer-process-limit': 2,
+        'process-per-site': None,
+        'disable-gpu': None,
+        'disable-gpu-compositing': None,
+        'disk-cache-size': 128 * 1024 * 1024,
+        'js-flags': '--max-old-space-size=256',
+    },
+    # Everything in the browser process; lowest memory, least isolation
+    'single-process': {
+        'single-process': None,
+        'disable-gpu': None,
+    },
+}
+
+
+def validate(flags):
+    """Return a list of problems with a flag set; empty if it is valid"""
+    problems = []
+    for name, value in flags.items():
+        validator = KNOWN_FLAGS.get(name)
+        if validator is None:
+            problems.append('unknown flag --{}'.format(name))
+        elif not validator(value):
+            problems.append('invalid value for --{}: {!r}'.format(name, value))
+    for first, second in CONFLICTS:
+        if first in flags and second in flags:
+            problems.append('--{} conflicts with --{}'.format(first, second))
+    return problems
+
+
+def format_flags(flags):
+    args = []
+    for name, value in flags.items():
+        if value is None:
+            args.append('--{}'.format(name))
+        else:
+            args.append('--{}={}'.format(name, value))
+    return args
+
+
+def configure(default='default'):
+    """
+    Merge the selected profile (TELEBROWSER_FLAGS_PROFILE) into
+    QTWEBENGINE_CHROMIUM_FLAGS. An invalid profile falls back to
+    Chromium's defaults instead of starting with a broken configuration.
+    """
+    name = os.environ.get('TELEBROWSER_FLAGS_PROFILE', default)
+    flags = FLAG_PROFILES.get(name)
+    if flags is None:
+        print("Unknown Chromium flags profile '{}', using defaults".format(name), file=sys.stderr)
+        return []
+
+    problems = validate(flags)
+    if problems:
+        print("Chromium flags profile '{}' rejected: {}".format(name, '; '.join(problems)), file=sys.stderr)
+        return []
+
+    args = format_flags(flags)
+    existing = os.environ.get(ENV_VAR, '').split()
+    # Explicit flags from the environment win over the profile
+    overridden = set(arg.split('=')[0] for arg in existing)
+    args = [arg for arg in args if arg.split('=')[0] not in overridden]
+    os.environ[ENV_VAR] = ' '.join(existing + args).strip()
+    print("Chromium flags ({}): {}".format(name, os.environ[ENV_VAR]))
+    return args
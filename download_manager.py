@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Download queue with concurrency limits, progress and retries for Tele Browser
+
+QtWebEngine cancels a download that is not accepted inside the
+downloadRequested handler, so queued downloads are accepted and paused
+immediately, then resumed when a slot frees up.
+"""
+
+import os
+import shutil
+import time
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWebEngineWidgets import QWebEngineDownloadItem
+
+MAX_PARALLEL = int(os.environ.get('TELEBROWSER_MAX_DOWNLOADS', '2'))
+# Free space that must remain after a download is accepted (MB)
+MIN_FREE_MB = int(os.environ.get('TELEBROWSER_MIN_FREE_MB', '200'))
+MAX_RETRIES = 3
+# Smoothing factor for the throughput estimate
+RATE_SMOOTHING = 0.3
+
+D = QWebEngineDownloadItem
+RETRYABLE_REASONS = (
+    D.NetworkFailed, D.NetworkTimeout, D.NetworkDisconnected,
+    D.NetworkServerDown, D.ServerFailed,
+)
+
+
+class DownloadTask:
+    """Progress bookkeeping for one download item"""
+    def __init__(self, item, filename, retries=0):
+        self.item = item
+        self.filename = filename
+        self.url = item.url()
+        self.retries = retries
+        self.received = 0
+        self.total = item.totalBytes()
+        self.rate = 0.0  # bytes per second
+        self.last_time = time.monotonic()
+        self.queued = False
+
+    def update(self, received, total):
+        now = time.monotonic()
+        elapsed = now - self.last_time
+        if elapsed > 0 and received >= self.received:
+            sample = (received - self.received) / elapsed
+            self.rate = sample if self.rate == 0 else (
+                RATE_SMOOTHING * sample + (1 - RATE_SMOOTHING) * self.rate)
+        self.received = received
+        self.total = total
+        self.last_time = now
+
+    def path(self):
+        return os.path.join(self.item.downloadDirectory(), self.item.downloadFileName())
+
+    def percent(self):
+        if self.total <= 0:
+            return None
+        return 100 * self.received // self.total
+
+    def describe(self):
+        percent = self.percent()
+        done = '{}%'.format(percent) if percent is not None else '{:.1f} MB'.format(self.received / (1024 * 1024))
+        return '{}: {} ({:.1f} MB/s)'.format(self.filename, done, self.rate / (1024 * 1024))
+
+
+class DownloadManager(QObject):
+    """Accepts, queues and tracks downloads for a profile"""
+    progress = pyqtSignal(object)
+    finished = pyqtSignal(object)
+    rejected = pyqtSignal(str, str)  # filename, reason
+
+    def __init__(self, directory, parallel=MAX_PARALLEL, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.parallel = max(1, parallel)
+        self.tasks = []
+        self.pending_retries = {}  # url -> retries already used
+
+    def running(self):
+        return [t for t in self.tasks if not t.queued]
+
+    def has_space_for(self, total_bytes):
+        free = shutil.disk_usage(self.directory).free
+        needed = max(total_bytes, 0) + MIN_FREE_MB * 1024 * 1024
+        return free >= needed
+
+    def handle(self, item, filename=None):
+        """Take over a download from downloadRequested; returns the task or None"""
+        filename = filename or item.suggestedFileName()
+        if not self.has_space_for(item.totalBytes()):
+            item.cancel()
+            self.rejected.emit(filename, 'not enough disk space')
+            return None
+
+        item.setDownloadDirectory(self.directory)
+        item.setDownloadFileName(filename)
+        item.accept()
+
+        task = DownloadTask(item, filename, self.pending_retries.pop(item.url().toString(), 0))
+        self.tasks.append(task)
+        if len(self.running()) > self.parallel:
+            # Over the limit: accepted, but held until a running download ends
+            self.pause(task)
+        item.downloadProgress.connect(lambda received, total, task=task: self.on_progress(task, received, total))
+        item.stateChanged.connect(lambda state, task=task: self.on_state_changed(task, state))
+        return task
+
+    def on_progress(self, task, received, total):
+        task.update(received, total)
+        self.progress.emit(task)
+
+    def on_state_changed(self, task, state):
+        if state in (D.DownloadRequested, D.DownloadInProgress):
+            return
+
+        self.tasks.remove(task)
+        if state == D.DownloadCompleted:
+            self.finished.emit(task)
+        elif state == D.DownloadInterrupted and not self.retry(task):
+            self.rejected.emit(task.filename, task.item.interruptReasonString())
+        self.start_next()
+
+    def retry(self, task):
+        """Request the URL again after a network interruption"""
+        page = task.item.page()
+        if (task.item.interruptReason() not in RETRYABLE_REASONS or
+                task.retries >= MAX_RETRIES or page is None):
+            return False
+        self.pending_retries[task.url.toString()] = task.retries + 1
+        page.download(task.url, task.filename)
+        return True
+
+    def pause(self, task):
+        task.queued = True
+        task.item.pause()
+        self.start_next()
+
+    def resume(self, task):
+        task.queued = False
+        task.item.resume()
+
+    def start_next(self):
+        queued = [t for t in self.tasks if t.queued]
+        while queued and len(self.running()) < self.parallel:
+            self.resume(queued.pop(0))
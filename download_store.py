@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Content-addressed storage and integrity checks for completed downloads
+
+Finished files are hashed in one streaming pass on a worker thread and
+hardlinked into <downloads>/.telebrowser-store/<aa>/<sha256>, so repeated
+downloads of the same content share one copy on disk. The store lives
+inside the downloads folder because hardlinks cannot cross filesystems.
+
+A stored object shares its inode with the downloads linked to it, so an
+in-place edit of any of them changes the object. Objects are therefore
+re-hashed before they are reused, and objects no download links to any
+more are removed at startup.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+from PyQt5.QtCore import QObject, pyqtSignal
+
+STORE_DIR = '.telebrowser-store'
+CHUNK_SIZE = 1024 * 1024
+
+
+def expected_digest(qurl):
+    """
+    Server-provided SHA-256 for a download, passed as a sha256=<hex>
+    query or fragment parameter on the link; None if there is none.
+    """
+    for part in (qurl.query(), qurl.fragment()):
+        values = parse_qs(part).get('sha256')
+        if values:
+            return values[0].lower()
+    return None
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_link(directory, target, exclude):
+    """Another file in directory that is a hardlink of target"""
+    target_stat = os.stat(target)
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.path == exclude or not entry.is_file(follow_symlinks=False):
+                continue
+            stat = entry.stat(follow_symlinks=False)
+            if stat.st_ino == target_stat.st_ino and stat.st_dev == target_stat.st_dev:
+                return entry.path
+    return None
+
+
+class DownloadStore(QObject):
+    """Hashes, verifies and deduplicates completed downloads off the GUI thread"""
+    # path, sha256, path of an existing copy if the new file was a duplicate
+    stored = pyqtSignal(str, str, str)
+    failed = pyqtSignal(str, str)  # path, reason
+
+    def __init__(self, directory, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.root = os.path.join(directory, STORE_DIR)
+        self.worker = ThreadPoolExecutor(max_workers=1)
+        self.worker.submit(self.prune)
+
+    def add(self, path, expected=None):
+        self.worker.submit(self.process, path, expected)
+
+    def stop(self):
+        self.worker.shutdown(wait=False)
+
+    def object_path(self, digest):
+        return os.path.join(self.root, digest[:2], digest)
+
+    def prune(self):
+        """Drop objects whose downloads have all been deleted"""
+        for dirpath, _, names in os.walk(self.root):
+            for name in names:
+                object_path = os.path.join(dirpath, name)
+                try:
+                    if os.stat(object_path).st_nlink == 1:
+                        os.remove(object_path)
+                except OSError:
+                    continue
+
+    def process(self, path, expected):
+        try:
+            digest = hash_file(path)
+            if expected and digest != expected:
+                os.remove(path)
+                self.failed.emit(path, 'checksum mismatch')
+                return
+
+            object_path = self.object_path(digest)
+            if os.path.exists(object_path) and hash_file(object_path) != digest:
+                # A linked download was edited in place; the object no longer
+                # holds this content, so store the freshly verified file instead
+                os.remove(object_path)
+            if not os.path.exists(object_path):
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                os.link(path, object_path)
+                self.stored.emit(path, digest, '')
+                return
+
+            # Same content already stored: a repeat click or a renamed copy
+            existing = find_link(os.path.dirname(path), object_path, path)
+            if existing:
+                os.remove(path)
+                self.stored.emit(path, digest, existing)
+                return
+
+            # Replace the new file with a link to the stored object
+            temp_path = path + '.link'
+            os.link(object_path, temp_path)
+            os.replace(temp_path, path)
+            self.stored.emit(path, digest, '')
+        except OSError as e:
+            self.failed.emit(path, str(e))
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Prefix index over visited URLs with frecency ranking
+
+URLs are indexed in a radix trie under their normalized form (no scheme,
+no "www.", lower case), so typing "exam" finds https://www.exam.org/.
+Every trie node keeps the best TOP_K entries of its subtree, which makes
+a lookup cost the length of the typed prefix plus TOP_K, independent of
+how many URLs are stored.
+
+Frecency is the sum of 2^(age / half-life) over all visits, kept in log2
+form relative to a fixed epoch. Decay applies to every entry equally, so
+scores never have to be recomputed and only grow when a URL is visited;
+that is what keeps the cached per-node rankings exact.
+"""
+
+import json
+import math
+import re
+
+TOP_K = 8
+HALF_LIFE_DAYS = 30
+TYPED_BONUS = 1.0  # log2 units: a typed visit counts as two link visits
+EPOCH = 1700000000  # fixed reference point for scores (2023-11-14)
+
+_SCHEME = re.compile(r'^[a-z][a-z0-9+.-]*://')
+
+
+def normalize(text):
+    """Key used for indexing and lookup: lower case, no scheme, no www."""
+    key = _SCHEME.sub('', text.strip().lower(), count=1)
+    if key.startswith('www.'):
+        key = key[4:]
+    return key
+
+
+def visit_weight(when, typed=False):
+    """log2 weight of one visit at unix time `when`"""
+    weight = (when - EPOCH) / (HALF_LIFE_DAYS * 86400.0)
+    return weight + TYPED_BONUS if typed else weight
+
+
+def log2_add(a, b):
+    """log2(2^a + 2^b) without overflow"""
+    if a is None:
+        return b
+    high, low = (a, b) if a >= b else (b, a)
+    return high + math.log2(1.0 + 2.0 ** (low - high))
+
+
+class Entry:
+    __slots__ = ('url', 'title', 'visits', 'last_visit', 'score')
+
+    def __init__(self, url, title='', visits=0, last_visit=0.0, score=None):
+        self.url = url
+        self.title = title
+        self.visits = visits
+        self.last_visit = last_visit
+        self.score = score
+
+    def rank(self):
+        return self.score if self.score is not None else float('-inf')
+
+
+class Node:
+    __slots__ = ('label', 'children', 'top')
+
+    def __init__(self, label=''):
+        self.label = label
+        self.children = {}  # first character of the child's label -> child
+        self.top = []       # best entries of this subtree, highest score first
+
+
+def offer(top, entry):
+    """Keep entry in a node's ranking if it belongs to the best TOP_K"""
+    if entry in top:
+        top.sort(key=Entry.rank, reverse=True)
+    elif len(top) < TOP_K:
+        top.append(entry)
+        top.sort(key=Entry.rank, reverse=True)
+    elif entry.rank() > top[-1].rank():
+        top[-1] = entry
+        top.sort(key=Entry.rank, reverse=True)
+
+
+class HistoryIndex:
+    """Visited URLs keyed by URL, searchable by normalized prefix"""
+
+    def __init__(self):
+        self.entries = {}
+        self.root = Node()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def visit(self, url, title='', when=0.0, typed=False):
+        """Record a visit and re-rank the URL on every node of its path"""
+        entry = self.entries.get(url)
+        if entry is None:
+            entry = self.entries[url] = Entry(url)
+        if title:
+            entry.title = title
+        entry.visits += 1
+        entry.last_visit = max(entry.last_visit, when)
+        entry.score = log2_add(entry.score, visit_weight(when, typed))
+        self.reindex(entry)
+        return entry
+
+    def restore(self, url, title, visits, last_visit, score):
+        """Add an entry with a precomputed score (loading a compacted file)"""
+        entry = self.entries[url] = Entry(url, title, visits, last_visit, score)
+        self.reindex(entry)
+        return entry
+
+    def reindex(self, entry):
+        key = normalize(entry.url)
+        node = self.root
+        offer(node.top, entry)
+        i = 0
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None:
+                leaf = Node(key[i:])
+                leaf.top.append(entry)
+                node.children[key[i]] = leaf
+                return
+
+            label = child.label
+            common = 0
+            limit = min(len(label), len(key) - i)
+            while common < limit and label[common] == key[i + common]:
+                common += 1
+            if common < len(label):
+                # Split the edge; the new node covers the same subtree
+                middle = Node(label[:common])
+                middle.top = list(child.top)
+                child.label = label[common:]
+                middle.children[child.label[0]] = child
+                node.children[key[i]] = middle
+                child = middle
+
+            offer(child.top, entry)
+            node = child
+            i += common
+
+    def suggest(self, text, limit=TOP_K):
+        """Best entries whose normalized URL starts with the normalized text"""
+        prefix = normalize(text)
+        node = self.root
+        i = 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+            if child is None:
+                return []
+            label = child.label
+            if not label.startswith(prefix[i:i + len(label)]):
+                return []
+            node = child
+            i += len(label)
+        return node.top[:limit]
+
+
+# History file: one JSON array per line, appended as visits happen.
+#   ["v", url, title, time, typed]                 a visit
+#   ["e", url, title, visits, last_visit, score]   an entry (compacted file)
+
+def visit_record(url, title, when, typed):
+    return json.dumps(['v', url, title, when, typed], ensure_ascii=False) + '\n'
+
+
+def entry_record(entry):
+    return json.dumps(['e', entry.url, entry.title, entry.visits,
+                       entry.last_visit, entry.score], ensure_ascii=False) + '\n'
+
+
+def load_lines(lines):
+    """Build an index from history file lines; returns (index, line count)"""
+    index = HistoryIndex()
+    count = 0
+    for line in lines:
+        count += 1
+        try:
+            record = json.loads(line)
+            if record[0] == 'v':
+                index.visit(record[1], record[2], record[3], record[4])
+            elif record[0] == 'e':
+                index.restore(*record[1:6])
+        except (ValueError, IndexError, TypeError):
+            # Torn last line after a crash, or a foreign line: skip it
+            continue
+    return index, count
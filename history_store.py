@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent browsing history for the Tele Browser address bar
+
+Visits are indexed in memory on the GUI thread (microseconds) and
+appended to an on-disk journal by a single background worker. The
+journal is read, indexed and compacted on that worker at startup, so
+neither loading tens of thousands of URLs nor any write blocks the UI.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, QStandardPaths, pyqtSignal
+
+from history_index import HistoryIndex, entry_record, load_lines, visit_record, TOP_K
+from session_store import write_atomic
+
+HISTORY_FILE = 'history.jsonl'
+# Rewrite the journal as one line per URL once it has this many lines per URL
+COMPACT_RATIO = 2
+
+
+class HistoryStore(QObject):
+    """Visited-URL history with prefix suggestions ranked by frecency"""
+    # Internal: carries the index built by the worker back to the GUI thread
+    index_loaded = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        history_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        if not os.path.exists(history_dir):
+            os.makedirs(history_dir)
+        self.path = os.path.join(history_dir, HISTORY_FILE)
+        self.index = HistoryIndex()
+        self.ready = False
+        self.early_visits = []  # recorded before the journal finished loading
+        self.worker = ThreadPoolExecutor(max_workers=1)
+        self.index_loaded.connect(self.on_index_loaded)
+
+    def start(self):
+        self.worker.submit(self.load)
+
+    def stop(self):
+        """Flush pending writes"""
+        self.worker.shutdown(wait=True)
+
+    def load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                index, lines = load_lines(f)
+        except FileNotFoundError:
+            index, lines = HistoryIndex(), 0
+        except OSError as e:
+            print("History not loaded: {}".format(e), file=sys.stderr)
+            index, lines = HistoryIndex(), 0
+
+        if lines > COMPACT_RATIO * len(index):
+            try:
+                data = ''.join(entry_record(entry) for entry in index.entries.values())
+                write_atomic(self.path, data.encode('utf-8'))
+            except OSError as e:
+                print("History compaction failed: {}".format(e), file=sys.stderr)
+        self.index_loaded.emit(index)
+
+    def on_index_loaded(self, index):
+        # Visits made while loading are already queued for the journal
+        for visit in self.early_visits:
+            index.visit(*visit)
+        self.early_visits = []
+        self.index = index
+        self.ready = True
+
+    def record_visit(self, url, title='', typed=False):
+        when = time.time()
+        if not self.ready:
+            self.early_visits.append((url, title, when, typed))
+        self.index.visit(url, title, when, typed)
+        self.worker.submit(self.append, visit_record(url, title, when, typed))
+
+    def append(self, line):
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+        except OSError as e:
+            print("History write failed: {}".format(e), file=sys.stderr)
+
+    def suggest(self, text, limit=TOP_K):
+        """Best matching entries for what has been typed so far"""
+        if not text.strip():
+            return []
+        return self.index.suggest(text, limit)
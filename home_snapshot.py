@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Offline MHTML snapshot of the home page for instant first paint
+"""
+
+import os
+import sys
+from PyQt5.QtCore import QObject, QStandardPaths, QUrl
+from PyQt5.QtWebEngineWidgets import QWebEngineDownloadItem
+
+SNAPSHOT_NAME = 'home.mhtml'
+
+
+class HomeSnapshot(QObject):
+    """
+    Keeps an MHTML copy of the last successfully loaded home page.
+    The snapshot is written to a temporary file by WebEngine and only
+    replaces the previous one once the save has completed.
+    """
+    def __init__(self, profile, home_url, parent=None):
+        super().__init__(parent)
+        self.home_url = QUrl(home_url)
+        self.enabled = os.environ.get('TELEBROWSER_HOME_SNAPSHOT', '1') != '0'
+
+        snapshot_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        if not os.path.exists(snapshot_dir):
+            os.makedirs(snapshot_dir)
+        self.path = os.path.join(snapshot_dir, SNAPSHOT_NAME)
+        self.temp_path = self.path + '.tmp'
+        self.saving = False
+
+        profile.downloadRequested.connect(self.on_download_requested)
+
+    def placeholder_url(self):
+        """URL of the stored snapshot, or None if there is nothing to show"""
+        if self.enabled and os.path.isfile(self.path) and os.path.getsize(self.path) > 0:
+            return QUrl.fromLocalFile(self.path)
+        return None
+
+    def is_home(self, url):
+        return url.adjusted(QUrl.StripTrailingSlash) == self.home_url.adjusted(QUrl.StripTrailingSlash)
+
+    def watch(self, page):
+        """Refresh the snapshot whenever this page finishes loading the home URL"""
+        page.loadFinished.connect(lambda ok, page=page: self.on_load_finished(page, ok))
+
+    def on_load_finished(self, page, ok):
+        if not ok or not self.enabled or self.saving or not self.is_home(page.url()):
+            return
+        self.saving = True
+        page.save(self.temp_path, QWebEngineDownloadItem.MimeHtmlSaveFormat)
+
+    def on_download_requested(self, download):
+        if not download.isSavePageDownload() or download.path() != self.temp_path:
+            return
+        download.finished.connect(lambda download=download: self.on_save_finished(download))
+
+    def on_save_finished(self, download):
+        self.saving = False
+        if download.state() != QWebEngineDownloadItem.DownloadCompleted:
+            print("Home snapshot failed: {}".format(download.interruptReasonString()), file=sys.stderr)
+            return
+        try:
+            os.replace(self.temp_path, self.path)
+        except OSError as e:
+            print("Home snapshot not stored: {}".format(e), file=sys.stderr)
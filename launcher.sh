@@ -0,0 +1,94 @@
+#!/bin/bash
+# Tele Browser fast-start launcher
+#
+# The PyInstaller --onedir bundle is appended to this script as a gzip'd
+# tar. It is extracted once into a cache directory keyed by the payload's
+# SHA-256 and reused on later starts, instead of unpacking the whole
+# Qt/Chromium payload to a temp dir on every launch like --onefile does.
+#
+# build_native_linux.sh fills in PAYLOAD_SHA256 and CRITICAL_SUMS and
+# appends the payload.
+#
+# Usage: TeleBrowser [--launcher-check] [browser arguments...]
+#   --launcher-check  prepare the cache and print its path without starting
+
+PAYLOAD_SHA256="@PAYLOAD_SHA256@"
+# sha256sum lines for the files that hold the code run at startup (the
+# executable with its embedded PYZ, base_library.zip, libpython). They
+# are kept here, in the installed launcher, because the cache itself is
+# user-writable and could carry forged checksums.
+CRITICAL_SUMS=$(cat <<'SUMS'
+@CRITICAL_SUMS@
+SUMS
+)
+CACHE_ROOT="${TELEBROWSER_CACHE_ROOT:-${XDG_CACHE_HOME:-$HOME/.cache}/telebrowser}"
+APP_DIR="$CACHE_ROOT/$PAYLOAD_SHA256"
+SELF="$(readlink -f "$0")"
+
+payload_line() {
+    awk '/^__PAYLOAD_BELOW__$/ { print NR + 1; exit 0 }' "$SELF"
+}
+
+list_files() {
+    (cd "$1" && find . -type f ! -name '.complete' ! -name '.manifest' -printf '%P %s\n' | LC_ALL=C sort)
+}
+
+# Checked on every start: the completion marker, the name and size of
+# every file against the manifest written at extraction, and the SHA-256
+# of the startup-critical files against the sums built into this script.
+# Anything that fails is extracted again from the verified payload.
+cache_is_valid() {
+    [ -f "$APP_DIR/.complete" ] || return 1
+    [ "$(cat "$APP_DIR/.complete")" = "$PAYLOAD_SHA256" ] || return 1
+    list_files "$APP_DIR" | cmp -s - "$APP_DIR/.manifest" || return 1
+    (cd "$APP_DIR" && printf '%s\n' "$CRITICAL_SUMS" | sha256sum --check --quiet --status)
+}
+
+extract() {
+    local line tmp actual
+    line="$(payload_line)"
+    if [ -z "$line" ]; then
+        echo "TeleBrowser: launcher has no payload" >&2
+        exit 1
+    fi
+
+    # Full integrity check of the payload before anything is unpacked
+    actual="$(tail -n +"$line" "$SELF" | sha256sum | cut -d' ' -f1)"
+    if [ "$actual" != "$PAYLOAD_SHA256" ]; then
+        echo "TeleBrowser: payload checksum mismatch, refusing to start" >&2
+        exit 1
+    fi
+
+    tmp="$(mktemp -d "$CACHE_ROOT/.extract.XXXXXX")" || exit 1
+    if ! tail -n +"$line" "$SELF" | tar -xzf - -C "$tmp"; then
+        rm -rf "$tmp"
+        echo "TeleBrowser: extraction failed" >&2
+        exit 1
+    fi
+    list_files "$tmp" > "$tmp/.manifest"
+    echo "$PAYLOAD_SHA256" > "$tmp/.complete"
+
+    rm -rf "$APP_DIR"
+    mv -T "$tmp" "$APP_DIR"
+
+    # Drop caches left behind by previous builds
+    find "$CACHE_ROOT" -mindepth 1 -maxdepth 1 -type d ! -name "$PAYLOAD_SHA256" -exec rm -rf {} +
+}
+
+mkdir -p "$CACHE_ROOT"
+if ! cache_is_valid; then
+    # Serialise concurrent first launches
+    exec 9>"$CACHE_ROOT/.lock"
+    flock 9
+    cache_is_valid || extract
+    flock -u 9
+    exec 9>&-
+fi
+
+if [ "$1" = "--launcher-check" ]; then
+    echo "$APP_DIR"
+    exit 0
+fi
+
+exec "$APP_DIR/TeleBrowser" "$@"
+exit 1
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Event-driven fullscreen lockdown enforcement for Tele Browser
+"""
+
+from PyQt5.QtCore import QObject, QTimer, Qt
+
+
+class FullscreenEnforcer(QObject):
+    """
+    Single owner of the fullscreen/on-top re-assert for a window.
+
+    Window events call request(); all requests that arrive before the
+    pending re-assert runs are coalesced into one, and the re-assert only
+    touches the window state that is actually wrong. There is no polling:
+    the enforcer is idle until Qt reports a state or focus change.
+    """
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        self.suspended = False
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.reassert)
+
+    def request(self, delay=0):
+        """Schedule a re-assert; an earlier pending one absorbs this request"""
+        if self.suspended or self.window.is_closing:
+            return
+        if self.timer.isActive() and self.timer.remainingTime() <= delay:
+            return
+        self.timer.start(delay)
+
+    def watch_window_handle(self):
+        """
+        Follow state changes of the native window directly. This replaces an
+        application-wide event filter, so no other object's events pass
+        through Python. Returns False until the window has a handle.
+        """
+        handle = self.window.windowHandle()
+        if handle is None:
+            return False
+        handle.windowStateChanged.connect(self.on_window_state_changed)
+        return True
+
+    def on_window_state_changed(self, state):
+        if not state & Qt.WindowFullScreen:
+            self.request()
+
+    def suspend(self):
+        self.suspended = True
+        self.timer.stop()
+
+    def resume(self):
+        self.suspended = False
+        self.request()
+
+    def reassert(self):
+        window = self.window
+        if self.suspended or window.is_closing:
+            return
+
+        if not window.isFullScreen() or window.windowState() & Qt.WindowMinimized:
+            window.setWindowState(Qt.WindowFullScreen)
+            window.showFullScreen()
+        if not window.isActiveWindow():
+            window.activateWindow()
+            window.raise_()
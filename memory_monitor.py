@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Renderer memory monitoring and eviction for Tele Browser
+"""
+
+import os
+import time
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+
+SAMPLE_INTERVAL_MS = int(os.environ.get('TELEBROWSER_MEMORY_SAMPLE_MS', '10000'))
+# Combined memory of all renderer processes before tabs are evicted (MB)
+TOTAL_LIMIT_MB = int(os.environ.get('TELEBROWSER_RENDERER_LIMIT_MB', '1536'))
+# Memory of a single renderer process before its tabs are evicted (MB)
+TAB_LIMIT_MB = int(os.environ.get('TELEBROWSER_TAB_LIMIT_MB', '768'))
+MAX_EVENTS = 100
+
+RENDERER_PROCESS_NAME = 'QtWebEngineProcess'
+# Zygote, GPU and utility processes share the name; only renderers host tabs
+RENDERER_TYPE_ARG = '--type=renderer'
+
+
+def read_pss(pid):
+    """
+    Proportional set size of a process in bytes from smaps_rollup.
+    Returns None when the kernel or platform does not provide it.
+    """
+    try:
+        with open('/proc/{}/smaps_rollup'.format(pid), 'r') as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def renderer_processes():
+    """QtWebEngineProcess renderer children of this browser process"""
+    import psutil  # Loaded on the first sample, not at startup
+    try:
+        children = psutil.Process().children(recursive=True)
+    except psutil.Error:
+        return []
+
+    renderers = []
+    for proc in children:
+        try:
+            if RENDERER_PROCESS_NAME in proc.name() and RENDERER_TYPE_ARG in proc.cmdline():
+                renderers.append(proc)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return renderers
+
+
+def sample_renderers():
+    """Map of renderer pid -> memory in bytes (PSS where available, else RSS)"""
+    import psutil
+    usage = {}
+    for proc in renderer_processes():
+        memory = read_pss(proc.pid)
+        if memory is None:
+            try:
+                memory = proc.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        usage[proc.pid] = memory
+    return usage
+
+
+class RendererMemoryMonitor(QObject):
+    """
+    Periodically samples renderer memory, attributes it to tabs through
+    QWebEnginePage.renderProcessPid() and evicts the worst offenders once
+    the per-renderer or total limit is crossed.
+    """
+    def __init__(self, tabs, tab_lifecycle=None, parent=None):
+        super().__init__(parent)
+        self.tabs = tabs
+        self.tab_lifecycle = tab_lifecycle
+        self.events = []  # Most recent eviction events, newest last
+        self.last_sample = {}
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.sample)
+        self.timer.start(SAMPLE_INTERVAL_MS)
+
+    def stop(self):
+        self.timer.stop()
+
+    def tabs_by_pid(self):
+        """Group tab views by the renderer process that hosts them"""
+        grouped = {}
+        for i in range(self.tabs.count()):
+            view = self.tabs.widget(i)
+            pid = view.page().renderProcessPid()
+            if pid:
+                grouped.setdefault(pid, []).append(view)
+        return grouped
+
+    def sample(self):
+        self.last_sample = sample_renderers()
+        grouped = self.tabs_by_pid()
+
+        offenders = sorted(
+            ((memory, pid) for pid, memory in self.last_sample.items() if pid in grouped),
+            reverse=True)
+        # Only renderers hosting a tab count; pooled and preconnect pages are not evictable
+        total_mb = sum(memory for memory, _ in offenders) / (1024 * 1024)
+
+        for memory, pid in offenders:
+            memory_mb = memory / (1024 * 1024)
+            if memory_mb < TAB_LIMIT_MB and total_mb < TOTAL_LIMIT_MB:
+                break
+            if self.evict(pid, grouped[pid], memory_mb):
+                total_mb -= memory_mb
+
+    def evict(self, pid, views, memory_mb):
+        """Discard background tabs of a renderer, or reload it if it is current"""
+        current = self.tabs.currentWidget()
+        evicted = False
+        for view in views:
+            if view is current:
+                if memory_mb >= TAB_LIMIT_MB:
+                    view.page().triggerAction(QWebEnginePage.Reload)
+                    self.record(pid, view, memory_mb, 'reload')
+                    evicted = True
+            elif self.tab_lifecycle and self.tab_lifecycle.discard(view):
+                self.record(pid, view, memory_mb, 'discard')
+                evicted = True
+        return evicted
+
+    def record(self, pid, view, memory_mb, action):
+        event = {
+            'time': time.time(),
+            'pid': pid,
+            'url': view.url().toString(),
+            'memory_mb': round(memory_mb, 1),
+            'action': action,
+        }
+        self.events.append(event)
+        del self.events[:-MAX_EVENTS]
+        print("Renderer {} using {:.1f} MB: {} {}".format(pid, memory_mb, action, event['url']))
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Minimal rtnetlink client used for network identity checks (Linux only)
+
+Queries the kernel routing, address and neighbour tables directly
+instead of forking `ip`. Every function raises OSError when netlink is unavailable so
+callers can fall back to another method.
+"""
+
+import errno
+import os
+import socket
+import struct
+import itertools
+
+NETLINK_ROUTE = 0
+
+# Message types
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+RTM_NEWADDR = 20
+RTM_GETADDR = 22
+RTM_NEWROUTE = 24
+RTM_GETROUTE = 26
+RTM_NEWNEIGH = 28
+RTM_GETNEIGH = 30
+
+# Flags
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+
+# Multicast groups
+RTMGRP_LINK = 0x1
+RTMGRP_NEIGH = 0x4
+RTMGRP_IPV4_IFADDR = 0x10
+RTMGRP_IPV4_ROUTE = 0x40
+
+# Route attributes
+RTA_DST = 1
+RTA_OIF = 4
+RTA_GATEWAY = 5
+RTA_PREFSRC = 7
+
+# Address attributes
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+
+# Neighbour attributes
+NDA_DST = 1
+NDA_LLADDR = 2
+
+NLMSG_HEADER = struct.Struct('=IHHII')   # len, type, flags, seq, pid
+RTMSG = struct.Struct('=BBBBBBBBI')      # family, dst_len, src_len, tos, table, protocol, scope, type, flags
+IFADDRMSG = struct.Struct('=BBBBI')      # family, prefixlen, flags, scope, index
+NDMSG = struct.Struct('=BBHiHBB')        # family, pad, pad, ifindex, state, flags, type
+RTATTR = struct.Struct('=HH')            # len, type
+
+_sequence = itertools.count(1)
+
+
+def align(length):
+    return (length + 3) & ~3
+
+
+def open_socket(groups=0):
+    """Netlink route socket, optionally subscribed to multicast groups"""
+    if not hasattr(socket, 'AF_NETLINK'):
+        raise OSError('netlink is not available on this platform')
+    sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE)
+    try:
+        sock.bind((0, groups))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def pack_attr(attr_type, payload):
+    length = RTATTR.size + len(payload)
+    return RTATTR.pack(length, attr_type) + payload + b'\0' * (align(length) - length)
+
+
+def parse_attrs(data, offset=0):
+    """Map of attribute type -> raw payload"""
+    attrs = {}
+    while offset + RTATTR.size <= len(data):
+        length, attr_type = RTATTR.unpack_from(data, offset)
+        if length < RTATTR.size:
+            break
+        attrs[attr_type] = data[offset + RTATTR.size:offset + length]
+        offset += align(length)
+    return attrs
+
+
+def iter_messages(data):
+    """Yield (type, flags, seq, payload) for each message in a datagram"""
+    offset = 0
+    while offset + NLMSG_HEADER.size <= len(data):
+        length, msg_type, flags, seq, _ = NLMSG_HEADER.unpack_from(data, offset)
+        if length < NLMSG_HEADER.size:
+            break
+        yield msg_type, flags, seq, data[offset + NLMSG_HEADER.size:offset + length]
+        offset += align(length)
+
+
+def check_error(payload):
+    """Raise the errno carried by an NLMSG_ERROR payload (0 means ACK)"""
+    (error,) = struct.unpack_from('=i', payload)
+    if error:
+        raise OSError(-error, os.strerror(-error))
+
+
+def request(sock, msg_type, flags, body):
+    seq = next(_sequence)
+    header = NLMSG_HEADER.pack(NLMSG_HEADER.size + len(body), msg_type, NLM_F_REQUEST | flags, seq, 0)
+    sock.send(header + body)
+    return seq
+
+
+def read_ip(payload, family):
+    return socket.inet_ntop(family, payload)
+
+
+def route_get(destination='8.8.8.8', timeout=1.0):
+    """
+    Equivalent of `ip route get <destination>`: returns a dict with the
+    egress interface name and index, gateway (or None) and source address.
+    """
+    family = socket.AF_INET6 if ':' in destination else socket.AF_INET
+    address = socket.inet_pton(family, destination)
+
+    sock = open_socket()
+    try:
+        sock.settimeout(timeout)
+        body = RTMSG.pack(family, len(address) * 8, 0, 0, 0, 0, 0, 0, 0) + pack_attr(RTA_DST, address)
+        seq = request(sock, RTM_GETROUTE, 0, body)
+
+        while True:
+            data = sock.recv(65536)
+            for msg_type, _, msg_seq, payload in iter_messages(data):
+                if msg_seq != seq:
+                    continue
+                if msg_type == NLMSG_ERROR:
+                    check_error(payload)
+                if msg_type == NLMSG_DONE:
+                    raise OSError(errno.ENETUNREACH, 'no route to {}'.format(destination))
+                if msg_type == RTM_NEWROUTE:
+                    return parse_route(payload)
+    finally:
+        sock.close()
+
+
+def parse_route(payload):
+    family = payload[0]
+    attrs = parse_attrs(payload, RTMSG.size)
+    if RTA_OIF not in attrs:
+        raise OSError('route has no output interface')
+    index = struct.unpack('=I', attrs[RTA_OIF][:4])[0]
+    return {
+        'interface': socket.if_indextoname(index),
+        'ifindex': index,
+        'gateway': read_ip(attrs[RTA_GATEWAY], family) if RTA_GATEWAY in attrs else None,
+        'source': read_ip(attrs[RTA_PREFSRC], family) if RTA_PREFSRC in attrs else None,
+    }
+
+
+def dump(msg_type, body, reply_type, timeout=1.0):
+    """Run a dump request and return the payloads of all reply messages"""
+    sock = open_socket()
+    try:
+        sock.settimeout(timeout)
+        seq = request(sock, msg_type, NLM_F_DUMP, body)
+        replies = []
+        while True:
+            data = sock.recv(65536)
+            for found_type, _, msg_seq, payload in iter_messages(data):
+                if msg_seq != seq:
+                    continue
+                if found_type == NLMSG_ERROR:
+                    check_error(payload)
+                if found_type == NLMSG_DONE:
+                    return replies
+                if found_type == reply_type:
+                    replies.append(payload)
+    finally:
+        sock.close()
+
+
+def interface_addresses(ifindex, family=socket.AF_INET):
+    """List of (address, prefix length) configured on an interface"""
+    addresses = []
+    for payload in dump(RTM_GETADDR, IFADDRMSG.pack(family, 0, 0, 0, 0), RTM_NEWADDR):
+        addr_family, prefixlen, _, _, index = IFADDRMSG.unpack_from(payload)
+        if index != ifindex or addr_family != family:
+            continue
+        attrs = parse_attrs(payload, IFADDRMSG.size)
+        raw = attrs.get(IFA_LOCAL) or attrs.get(IFA_ADDRESS)
+        if raw:
+            addresses.append((read_ip(raw, family), prefixlen))
+    return addresses
+
+
+def neighbour_mac(ifindex, address):
+    """Link-layer address of a neighbour (e.g. the gateway), or None"""
+    family = socket.AF_INET6 if ':' in address else socket.AF_INET
+    wanted = socket.inet_pton(family, address)
+    for payload in dump(RTM_GETNEIGH, NDMSG.pack(family, 0, 0, 0, 0, 0, 0), RTM_NEWNEIGH):
+        _, _, _, index, _, _, _ = NDMSG.unpack_from(payload)
+        if index != ifindex:
+            continue
+        attrs = parse_attrs(payload, NDMSG.size)
+        if attrs.get(NDA_DST) == wanted and attrs.get(NDA_LLADDR):
+            return ':'.join('{:02x}'.format(b) for b in attrs[NDA_LLADDR])
+    return None
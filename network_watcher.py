@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Push-based network change detection for Tele Browser
+
+Subscribes to kernel link, address and route notifications over
+rtnetlink instead of polling. Bursts of notifications (a DHCP exchange
+can produce dozens) are debounced into a single identity check, and
+identity_changed is only emitted when the identity really differs.
+
+The identity itself is resolved on a worker thread and cached, so no
+caller on the GUI thread ever waits for netlink or a child process.
+"""
+
+import errno
+import ipaddress
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, QSocketNotifier, QTimer, pyqtSignal
+
+import netlink
+
+DEBOUNCE_MS = int(os.environ.get('TELEBROWSER_NETWORK_DEBOUNCE_MS', '500'))
+# Neighbour events let a gateway MAC that resolves late trigger a recheck
+GROUPS = (netlink.RTMGRP_LINK | netlink.RTMGRP_NEIGH |
+          netlink.RTMGRP_IPV4_IFADDR | netlink.RTMGRP_IPV4_ROUTE)
+
+
+class NetworkIdentity(namedtuple('NetworkIdentity', 'interface gateway mac subnet')):
+    __slots__ = ()
+
+    def __str__(self):
+        return '{} gw={} mac={} net={}'.format(*self)
+
+
+# No route to the internet (cable pulled, Wi-Fi dropped): a real answer
+# from netlink, not a failed lookup
+NO_ROUTE = NetworkIdentity(None, None, None, None)
+NO_ROUTE_ERRORS = (errno.ENETUNREACH, errno.EHOSTUNREACH)
+
+
+def known(identity):
+    """True if identity names an actual network, not no-route or a failed lookup"""
+    return identity is not None and identity != NO_ROUTE
+
+
+def same_network(a, b):
+    """
+    True if two identities describe the same network. A gateway MAC that
+    is not known (neighbour entry missing while ARP resolves) matches any
+    MAC rather than counting as a value of its own.
+    """
+    if isinstance(a, NetworkIdentity) and isinstance(b, NetworkIdentity):
+        if a.mac and b.mac and a.mac != b.mac:
+            return False
+        return a._replace(mac=None) == b._replace(mac=None)
+    return a == b
+
+
+def learns_mac(old, new):
+    """True if new is the same network as old with its gateway MAC now known"""
+    return (isinstance(old, NetworkIdentity) and isinstance(new, NetworkIdentity) and
+            old.mac is None and new.mac is not None and same_network(old, new))
+
+
+def network_fingerprint():
+    """
+    Composite identity of the network in use: egress interface, gateway
+    IP, gateway MAC and subnet, all read from kernel tables over netlink.
+    The host's own address is left out so a DHCP renewal that hands out a
+    different address in the same subnet is not reported as a change.
+    Returns NO_ROUTE when the kernel has no route towards the internet.
+    """
+    try:
+        route = netlink.route_get('8.8.8.8')
+    except OSError as e:
+        if e.errno in NO_ROUTE_ERRORS:
+            return NO_ROUTE
+        raise
+    ifindex, gateway = route['ifindex'], route['gateway']
+
+    mac = netlink.neighbour_mac(ifindex, gateway) if gateway else None
+
+    subnet = None
+    for address, prefixlen in netlink.interface_addresses(ifindex):
+        if route['source'] in (None, address):
+            subnet = str(ipaddress.ip_interface('{}/{}'.format(address, prefixlen)).network)
+            break
+
+    return NetworkIdentity(route['interface'], gateway, mac, subnet)
+
+
+def resolve_network_id():
+    """
+    Identity of the network towards the internet. Blocking and
+    thread-safe: uses the netlink fingerprint and forks `ip route` only
+    if netlink is unavailable.
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        return network_fingerprint()
+    except OSError:
+        pass
+    import subprocess
+    try:
+        result = subprocess.check_output(['ip', 'route', 'get', '8.8.8.8'],
+                                         stderr=subprocess.STDOUT, timeout=5)
+        result = result.decode('utf-8')
+        if 'dev' in result:
+            return result.split('dev')[1].split()[0]
+    except (OSError, subprocess.SubprocessError, IndexError):
+        pass
+    return None
+
+
+class NetworkWatcher(QObject):
+    """Keeps the current network identity up to date from kernel events"""
+    identity_changed = pyqtSignal(object)
+    # Internal: carries worker results back to the GUI thread
+    resolved = pyqtSignal(object)
+
+    def __init__(self, resolve_identity=resolve_network_id, fallback=None, parent=None):
+        super().__init__(parent)
+        self.resolve_identity = resolve_identity
+        # GUI-thread lookup used when the worker finds nothing; only set when
+        # netlink is unavailable, since netlink reports no route as NO_ROUTE
+        self.fallback = fallback
+        self.identity = None
+        self.valid = False
+        self.sock = None
+        self.notifier = None
+
+        self.worker = ThreadPoolExecutor(max_workers=1)
+        self.in_flight = False
+        self.rerun = False
+        self.resolved.connect(self.on_resolved)
+
+        self.debounce = QTimer(self)
+        self.debounce.setSingleShot(True)
+        self.debounce.setInterval(DEBOUNCE_MS)
+        self.debounce.timeout.connect(self.invalidate)
+
+    def start(self):
+        """
+        Resolve the initial identity in the background and subscribe to
+        kernel notifications. Returns False if netlink is unavailable; the
+        caller must then call invalidate() from its own change signal.
+        """
+        self.invalidate()
+        try:
+            self.sock = netlink.open_socket(GROUPS)
+        except OSError:
+            return False
+        self.sock.setblocking(False)
+
+        self.notifier = QSocketNotifier(self.sock.fileno(), QSocketNotifier.Read, self)
+        self.notifier.activated.connect(self.on_readable)
+        return True
+
+    def stop(self):
+        self.debounce.stop()
+        if self.notifier:
+            self.notifier.setEnabled(False)
+            self.notifier = None
+        if self.sock:
+            self.sock.close()
+            self.sock = None
+        self.worker.shutdown(wait=False)
+
+    def on_readable(self):
+        # Drain everything queued; the content does not matter, only that
+        # something changed, and the debounce timer restarts on each burst
+        try:
+            while self.sock.recv(65536):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError:
+            # ENOBUFS: notifications were dropped, re-check anyway
+            pass
+        self.debounce.start()
+
+    def invalidate(self):
+        """Mark the cached identity stale and resolve it again off the GUI thread"""
+        self.valid = False
+        if self.in_flight:
+            self.rerun = True
+            return
+        self.in_flight = True
+        self.worker.submit(self.resolve_in_worker)
+
+    def resolve_in_worker(self):
+        try:
+            identity = self.resolve_identity()
+        except Exception:
+            identity = None
+        self.resolved.emit(identity)
+
+    def on_resolved(self, identity):
+        self.in_flight = False
+        if self.rerun:
+            # Another change arrived while resolving; this result is stale
+            self.rerun = False
+            self.invalidate()
+            return
+
+        if identity is None and self.fallback:
+            identity = self.fallback()
+        self.valid = True
+        if identity == self.identity:
+            return
+        if same_network(identity, self.identity) and not learns_mac(self.identity, identity):
+            # Only the gateway MAC became unknown; keep the known one
+            return
+        self.identity = identity
+        self.identity_changed.emit(identity)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Pool of pre-built browser views for instant new tabs in Tele Browser
+"""
+
+import os
+from PyQt5.QtCore import QObject, QTimer
+
+POOL_SIZE = int(os.environ.get('TELEBROWSER_PAGE_POOL', '2'))
+# Delay before refilling so construction does not compete with the new tab
+REFILL_DELAY_MS = 500
+
+
+class PagePool(QObject):
+    """
+    Keeps a few fully configured views ready so new tabs and popups skip
+    view/page construction. The pool is refilled one view per event-loop
+    turn once the application is idle again.
+    """
+    def __init__(self, factory, size=POOL_SIZE, parent=None):
+        super().__init__(parent)
+        self.factory = factory
+        self.size = size
+        self.views = []
+        self.refill_pending = False
+
+    def acquire(self):
+        """Return a ready view, building one on the spot if the pool is empty"""
+        if self.views:
+            view = self.views.pop()
+        else:
+            view = self.factory()
+        self.schedule_refill()
+        return view
+
+    def schedule_refill(self):
+        if self.refill_pending or len(self.views) >= self.size:
+            return
+        self.refill_pending = True
+        QTimer.singleShot(REFILL_DELAY_MS, self.refill)
+
+    def refill(self):
+        self.refill_pending = False
+        if len(self.views) >= self.size:
+            return
+        self.views.append(self.factory())
+        if len(self.views) < self.size:
+            # Build the next one on a later turn to keep the UI responsive
+            self.refill_pending = True
+            QTimer.singleShot(0, self.refill)
+
+    def clear(self):
+        self.size = 0
+        for view in self.views:
+            view.page().deleteLater()
+            view.deleteLater()
+        self.views = []
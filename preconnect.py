@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+DNS and connection prewarming for the home and critical origins
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+import startup_trace
+from PyQt5.QtCore import QTimer, QUrl
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+
+PRECONNECT_ORIGINS = [o.strip() for o in os.environ.get('TELEBROWSER_PRECONNECT_ORIGINS', '').split(',') if o.strip()]
+# How long the hidden preconnect page is kept alive (ms)
+PRECONNECT_LIFETIME_MS = 30000
+
+resolve_times = {}  # host -> milliseconds spent resolving, None on failure
+
+
+def origins_with(home_url):
+    """Home origin followed by any configured critical origins"""
+    origins = [home_url]
+    for origin in PRECONNECT_ORIGINS:
+        if origin not in origins:
+            origins.append(origin)
+    return origins
+
+
+def resolve_origins(origins):
+    """Resolve every origin so the system resolver cache is warm for Chromium"""
+    for origin in origins:
+        parts = urlsplit(origin)
+        if not parts.hostname:
+            continue
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        start = time.monotonic()
+        try:
+            socket.getaddrinfo(parts.hostname, port, proto=socket.IPPROTO_TCP)
+            resolve_times[parts.hostname] = (time.monotonic() - start) * 1000
+        except OSError:
+            resolve_times[parts.hostname] = None
+        # Shows up in the startup trace on its own thread, off the critical path
+        startup_trace.add_span('dns prewarm {}'.format(parts.hostname), start, time.monotonic())
+    print("DNS prewarm: {}".format(', '.join(
+        '{}={}'.format(host, 'failed' if ms is None else '{:.0f}ms'.format(ms))
+        for host, ms in resolve_times.items())), file=sys.stderr)
+
+
+def start_dns_prewarm(origins):
+    """Resolve origins on a background thread while startup continues"""
+    thread = threading.Thread(target=resolve_origins, args=(origins,), daemon=True)
+    thread.start()
+    return thread
+
+
+def start_preconnect(profile, origins, parent=None):
+    """
+    Ask Chromium to open connections (DNS, TCP and TLS) to the origins
+    through a hidden page with preconnect hints. The sockets land in the
+    profile's pool and are reused by the first real navigation.
+    """
+    # Navigations use non-CORS sockets, subresources often use CORS ones
+    links = ''.join('<link rel="preconnect" href="{0}"><link rel="preconnect" href="{0}" crossorigin>'.format(o)
+                    for o in origins)
+    page = QWebEnginePage(profile, parent)
+    page.setHtml('<html><head>{}</head><body></body></html>'.format(links), QUrl('about:blank'))
+    QTimer.singleShot(PRECONNECT_LIFETIME_MS, page.deleteLater)
+    return page
@@ -1,21 +1,48 @@
 # -*- coding: utf-8 -*-
+import startup_trace
+_imports_started = startup_trace.now()
 from anti_debug import check_debugger, check_vm, anti_debug_loop
 import threading
 import sys
 import os
-import subprocess
 import time
 from PyQt5.QtCore import QUrl, Qt, QEvent, QStandardPaths, QTimer
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, 
                              QHBoxLayout, QWidget, QLineEdit, QPushButton, 
                              QToolBar, QAction, QMessageBox, QTabWidget, QTabBar)
-from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineSettings, QWebEngineProfile
+# QtWebEngineWidgets must be loaded before QApplication exists, and the page
+# classes below subclass it, so it is the one heavy import that stays eager.
+# Modules only needed by later startup steps are imported where they are used.
+from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineSettings
 from PyQt5.QtGui import QIcon, QKeySequence
-from PyQt5.QtNetwork import QNetworkConfigurationManager
+from browser_profile import create_profile, report_cache_usage, warm_cache, cache_stats
+from tab_lifecycle import TabLifecycleManager
+from memory_monitor import RendererMemoryMonitor
+from page_pool import PagePool
+from home_snapshot import HomeSnapshot
+from preconnect import origins_with, start_dns_prewarm, start_preconnect
+from session_store import SessionStore
+from settings_presets import apply_preset
+from lockdown import FullscreenEnforcer
+import chromium_flags
+import single_instance
+from staged_startup import StartupSequence, show_splash
+startup_trace.add_span('imports', _imports_started, startup_trace.now())
+
+# Overridable so benchmarks can run against a local page
+HOME_URL = os.environ.get('TELEBROWSER_HOME_URL', 'https://ksjc.teleuniv.in')
+# Delay before reloading the live home page behind the snapshot after a failed load
+HOME_RETRY_MS = 5000
+# Origins a later launch may ask the running browser to open
+HANDOFF_ORIGINS = [HOME_URL] + [o.strip() for o in os.environ.get('TELEBROWSER_HANDOFF_ORIGINS', '').split(',') if o.strip()]
+
+# Resolve the home origin while the security checks and UI setup run
+start_dns_prewarm(origins_with(HOME_URL))
 
 # Before class definitions
-check_debugger()
-check_vm()
+with startup_trace.phase('anti-debug checks'):
+    check_debugger()
+    check_vm()
 
 # Start anti-debug thread
 debug_thread = threading.Thread(target=anti_debug_loop, daemon=True)
@@ -87,10 +114,19 @@ class ClipboardManager:
 
 class SecureWebPage(QWebEnginePage):
     """Custom web page that controls copy-paste operations"""
-    def __init__(self, parent=None, main_window=None):
-        super().__init__(parent)
+    def __init__(self, parent=None, main_window=None, profile=None):
+        if profile is not None:
+            super().__init__(profile, parent)
+        else:
+            super().__init__(parent)
         self.main_window = main_window
         self.loadFinished.connect(self.inject_security_script)
+        self.loadFinished.connect(self.on_load_finished)
+    
+    def on_load_finished(self, ok):
+        """Record how much of the page came from the HTTP cache"""
+        if ok:
+            report_cache_usage(self)
     
     def inject_security_script(self):
         """Inject JavaScript to control copy/paste in web pages"""
@@ -325,14 +361,74 @@ class TeleBrowser(QMainWindow):
         self.countdown_seconds = 30
         self.warning_dialog = None
         self.network_manager = None
+        self.network_watcher = None
         self.is_closing = False
         self.clipboard_manager = ClipboardManager()
-        self.fullscreen_timer = None  # Timer to enforce fullscreen
-        self.initUI()
+        self.lockdown = FullscreenEnforcer(self)  # Re-asserts fullscreen on window events
+        self.window_handle_watched = False
+        self.profile = None
+        self.preconnect_page = None
+        self.cache_warmer = None
+        self.tab_lifecycle = None
+        self.memory_monitor = None
+        self.page_pool = None
+        self.home_snapshot = None
+        self.home_placeholder = None
+        self.home_live = None
+        self.session_store = None
+        self.download_manager = None
+        self.download_store = None
+        self.splash = None
+        self.pending_handoffs = []
+        
+        # Built one step per event-loop turn so a splash can paint first
+        self.startup = StartupSequence([
+            ('web engine', self.setup_web_engine),
+            ('build UI', self.build_ui),
+            ('first tab', self.open_first_tabs),
+            ('network monitoring', self.setup_network_monitoring),
+            ('downloads', self.setup_downloads),
+            ('cache warmer', self.start_cache_warmer),
+        ], self)
+        self.startup.progressed.connect(self.on_startup_progressed)
+        self.startup.finished.connect(self.on_startup_finished)
         self.setupShortcuts()
-        self.start_fullscreen_monitor()
+        self.startup.start()
+    
+    def setup_web_engine(self):
+        """Profile, preconnect and page pool; the first step that starts Chromium"""
+        self.profile = create_profile(QApplication.instance())
+        apply_preset(self.profile, 'strict-exam')
+        self.preconnect_page = start_preconnect(self.profile, origins_with(HOME_URL), self)
+        self.page_pool = PagePool(self.create_browser_view, parent=self)
+        self.home_snapshot = HomeSnapshot(self.profile, HOME_URL, self)
+    
+    def show_over_splash(self, splash):
+        """
+        Keep the splash until the window can replace it; on_startup_progressed
+        shows the window and closes the splash once the UI has been built.
+        """
+        self.splash = splash
+    
+    def on_startup_progressed(self, step):
+        if step != 'build UI' or self.splash is None:
+            return
+        with startup_trace.phase('show'):
+            self.showFullScreen()  # Open in full screen mode
+            self.activateWindow()
+            self.raise_()
+        self.splash.finish(self)
+        self.splash = None
+    
+    def on_startup_finished(self):
+        for args in self.pending_handoffs:
+            self.open_handed_over(args)
+        self.pending_handoffs = []
+    
+    def start_cache_warmer(self):
+        self.cache_warmer = warm_cache(self.profile, parent=self)
         
-    def initUI(self):
+    def build_ui(self):
         self.setWindowTitle('Tele Web Browser')
         self.setGeometry(100, 100, 1200, 800)
         
@@ -506,13 +602,21 @@ class TeleBrowser(QMainWindow):
         self.tabs.currentChanged.connect(self.update_url_bar)
         layout.addWidget(self.tabs)
         
-        self.add_new_tab(QUrl('https://ksjc.teleuniv.in'), 'Home')
-        
-        self.setup_downloads()
-        self.setup_network_monitoring()
+        self.tab_lifecycle = TabLifecycleManager(self.tabs, self)
+        self.memory_monitor = RendererMemoryMonitor(self.tabs, self.tab_lifecycle, self)
+        self.session_store = SessionStore(self.tabs, self)
         
         self.statusBar().showMessage('Tele Browser - Copyright©2025 Teleparadigm Networks Ltd')
     
+    def open_first_tabs(self):
+        # After a crash the previous tabs come back instead of the home page
+        if self.session_store.restore(self.open_tab):
+            self.tabs.currentWidget().loadFinished.connect(
+                lambda ok: startup_trace.finish('session restored'))
+        else:
+            self.open_home_tab()
+        self.session_store.start()
+    
     def navigate_to_url(self):
         """Not used - address bar removed"""
         pass
@@ -522,47 +626,78 @@ class TeleBrowser(QMainWindow):
         pass
         
     def setup_downloads(self):
+        from download_manager import DownloadManager
+        from download_store import DownloadStore
+        
         downloads_path = QStandardPaths.writableLocation(QStandardPaths.DownloadLocation)
         
         if not os.path.exists(downloads_path):
             os.makedirs(downloads_path)
         
-        profile = QWebEngineProfile.defaultProfile()
+        profile = self.profile
         profile.setDownloadPath(downloads_path)
         profile.downloadRequested.connect(self.on_download_requested)
+        
+        self.download_manager = DownloadManager(downloads_path, parent=self)
+        self.download_manager.progress.connect(self.on_download_progress)
+        self.download_manager.finished.connect(self.on_download_completed)
+        self.download_manager.rejected.connect(self.on_download_rejected)
+        
+        self.download_store = DownloadStore(downloads_path, self)
+        self.download_store.stored.connect(self.on_download_stored)
+        self.download_store.failed.connect(lambda path, reason: self.on_download_rejected(os.path.basename(path), reason))
     
     def on_download_requested(self, download):
-        filename = download.suggestedFileName()
-        downloads_path = QStandardPaths.writableLocation(QStandardPaths.DownloadLocation)
+        # Page snapshots are handled by HomeSnapshot
+        if download.isSavePageDownload():
+            return
         
-        download.setDownloadDirectory(downloads_path)
-        download.setDownloadFileName(filename)
-        download.accept()
+        task = self.download_manager.handle(download)
+        if task is None:
+            return
         
-        self.statusBar().showMessage('Downloading: {} to Downloads folder'.format(filename), 5000)
-        download.finished.connect(lambda: self.on_download_finished(filename))
+        if task.queued:
+            self.statusBar().showMessage('Download queued: {}'.format(task.filename), 5000)
+        else:
+            self.statusBar().showMessage('Downloading: {} to Downloads folder'.format(task.filename), 5000)
+    
+    def on_download_progress(self, task):
+        self.statusBar().showMessage('Downloading {}'.format(task.describe()), 2000)
+    
+    def on_download_completed(self, task):
+        self.on_download_finished(task.filename)
+        from download_store import expected_digest
+        self.download_store.add(task.path(), expected_digest(task.url))
     
     def on_download_finished(self, filename):
         self.statusBar().showMessage('Download completed: {}'.format(filename), 5000)
     
-    def setup_network_monitoring(self):
-        self.network_manager = QNetworkConfigurationManager()
-        self.initial_network = self.get_current_network_id()
-        self.network_manager.configurationChanged.connect(self.on_network_changed)
-        print("Initial Network ID: {}".format(self.initial_network))
+    def on_download_stored(self, path, digest, existing):
+        if existing:
+            self.statusBar().showMessage('Already downloaded: {}'.format(os.path.basename(existing)), 5000)
     
-    def get_current_network_id(self):
-        try:
-            if sys.platform.startswith('linux'):
-                result = subprocess.check_output(['ip', 'route', 'get', '8.8.8.8'], 
-                                                stderr=subprocess.STDOUT)
-                result = result.decode('utf-8')
-                if 'dev' in result:
-                    interface = result.split('dev')[1].split()[0]
-                    return interface
-        except:
-            pass
+    def on_download_rejected(self, filename, reason):
+        self.statusBar().showMessage('Download failed: {} ({})'.format(filename, reason), 5000)
+    
+    def setup_network_monitoring(self):
+        from network_watcher import NetworkWatcher, resolve_network_id
         
+        # The identity is resolved on a worker thread and cached by the watcher
+        self.network_watcher = NetworkWatcher(resolve_network_id, parent=self)
+        self.network_watcher.identity_changed.connect(self.on_network_identity_changed)
+        if not self.network_watcher.start():
+            # No kernel notifications: fall back to Qt's bearer polling. The
+            # first result arrives through the event loop, after this is set.
+            from PyQt5.QtNetwork import QNetworkConfigurationManager
+            self.network_manager = QNetworkConfigurationManager()
+            self.network_manager.configurationChanged.connect(self.on_network_changed)
+            self.network_watcher.fallback = self.get_qt_network_id
+    
+    def current_network_id(self):
+        """Last known network identity; never blocks"""
+        return self.network_watcher.identity
+    
+    def get_qt_network_id(self):
         active_config = self.network_manager.defaultConfiguration()
         if active_config.isValid():
             return active_config.identifier()
@@ -570,10 +705,25 @@ class TeleBrowser(QMainWindow):
         return None
     
     def on_network_changed(self, config):
-        current_network = self.get_current_network_id()
+        self.network_watcher.invalidate()
+    
+    def on_network_identity_changed(self, current_network):
+        from network_watcher import known, learns_mac, same_network
+        
+        if not known(current_network):
+            # Offline or lookup failed: nothing to compare against
+            print("Network unavailable: {}".format(current_network))
+            return
+        
+        if not known(self.initial_network) or learns_mac(self.initial_network, current_network):
+            # First network seen after startup, or the gateway MAC became known
+            self.initial_network = current_network
+            print("Initial Network ID: {}".format(self.initial_network))
+            return
+        
         print("Network changed. Current: {}, Initial: {}".format(current_network, self.initial_network))
         
-        if current_network != self.initial_network and current_network is not None:
+        if not same_network(current_network, self.initial_network):
             self.show_network_warning()
     
     def show_network_warning(self):
@@ -608,8 +758,10 @@ class TeleBrowser(QMainWindow):
     def update_countdown(self):
         self.countdown_seconds -= 1
         
-        current_network = self.get_current_network_id()
-        if current_network == self.initial_network:
+        from network_watcher import same_network
+        
+        current_network = self.current_network_id()
+        if same_network(current_network, self.initial_network):
             self.close_warning_dialog()
             self.statusBar().showMessage('Network restored. Continuing...', 3000)
             return
@@ -624,39 +776,117 @@ class TeleBrowser(QMainWindow):
             if self.warning_dialog:
                 self.warning_dialog.setText('Network connection has changed!\n\nApplication will close in {} seconds...'.format(self.countdown_seconds))
     
-    def add_new_tab(self, qurl=None, label="New Tab"):
-        if qurl is None:
-            qurl = QUrl('https://ksjc.teleuniv.in')
-
+    def create_browser_view(self):
+        """Build a configured view with a secure page; used to fill the page pool"""
         browser = QWebEngineView()
-        secure_page = SecureWebPage(browser, self)
+        secure_page = SecureWebPage(browser, self, self.profile)
         browser.setPage(secure_page)
-        
-        settings = browser.settings()
-        settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
-        settings.setAttribute(QWebEngineSettings.PluginsEnabled, False)
-        settings.setAttribute(QWebEngineSettings.JavascriptCanAccessClipboard, False)
-        settings.setAttribute(QWebEngineSettings.ShowScrollBars, True)
-        
-        browser.setUrl(qurl)
         browser.setContextMenuPolicy(Qt.NoContextMenu)
-        
-        i = self.tabs.addTab(browser, label)
+        return browser
+    
+    def open_tab(self, label):
+        """Take a view from the pool and add it as the current tab"""
+        browser = self.page_pool.acquire()
+        self.attach_tab(browser, label)
+        return browser
+    
+    def attach_tab(self, browser, label, index=-1):
+        i = self.tabs.insertTab(index, browser, label)
         self.tabs.setCurrentIndex(i)
         
         browser.titleChanged.connect(lambda title, browser=browser: self.update_tab_title(browser, title))
+        self.home_snapshot.watch(browser.page())
+    
+    def open_home_tab(self):
+        """Show the stored home snapshot while the live home page loads"""
+        home_url = QUrl(HOME_URL)
+        placeholder_url = self.home_snapshot.placeholder_url()
+        if placeholder_url is None:
+            browser = self.add_new_tab(home_url, 'Home')
+            browser.loadFinished.connect(lambda ok: ok and startup_trace.finish('home loaded'))
+            return
+        
+        # Read-only placeholder: no scripts and no input
+        self.home_placeholder = self.open_tab('Home')
+        self.home_placeholder.settings().setAttribute(QWebEngineSettings.JavascriptEnabled, False)
+        self.home_placeholder.setEnabled(False)
+        self.home_placeholder.loadFinished.connect(lambda ok: startup_trace.mark('snapshot painted'))
+        self.home_placeholder.setUrl(placeholder_url)
+        
+        # The live page loads off-screen and replaces the placeholder when done
+        self.home_live = self.page_pool.acquire()
+        self.home_live.loadFinished.connect(self.on_live_home_loaded)
+        self.home_live.setUrl(home_url)
+    
+    def on_live_home_loaded(self, ok):
+        live, placeholder = self.home_live, self.home_placeholder
+        if live is None:
+            return
+        if not ok:
+            # Offline or a TLS error: keep the snapshot up rather than
+            # swapping in Chromium's error page, and try again later
+            QTimer.singleShot(HOME_RETRY_MS, self.retry_live_home)
+            return
+        self.home_live = self.home_placeholder = None
+        live.loadFinished.disconnect(self.on_live_home_loaded)
+        startup_trace.finish('home loaded')
+        
+        index = self.tabs.indexOf(placeholder)
+        if index == -1:
+            self.attach_tab(live, 'Home')
+        else:
+            previous = self.tabs.currentWidget()
+            self.attach_tab(live, 'Home', index)
+            self.tabs.removeTab(index + 1)
+            self.release_tab(placeholder)
+            if previous is not placeholder:
+                self.tabs.setCurrentWidget(previous)
+        
+        # The snapshot watcher was connected after this load started
+        self.home_snapshot.on_load_finished(live.page(), ok)
+    
+    def retry_live_home(self):
+        if self.home_live is not None:
+            self.home_live.setUrl(QUrl(HOME_URL))
+    
+    def add_new_tab(self, qurl=None, label="New Tab"):
+        if qurl is None:
+            qurl = QUrl(HOME_URL)
+
+        browser = self.open_tab(label)
+        browser.setUrl(qurl)
         
         return browser
     
+    def open_handed_over(self, args):
+        """Open the allowed URLs passed to a later launch of the browser, or a home tab"""
+        if not self.startup.done:
+            # Tabs cannot be opened yet; replayed by on_startup_finished
+            self.pending_handoffs.append(args)
+            return
+        urls = [arg for arg in args if not arg.startswith('-')]
+        for url in urls:
+            qurl = single_instance.allowed_url(url, HANDOFF_ORIGINS)
+            if qurl is None:
+                print("Ignored handed-over URL outside the allowed origins: {}".format(url))
+                continue
+            self.add_new_tab(qurl)
+        if not urls:
+            self.add_new_tab()
+        self.activateWindow()
+        self.raise_()
+        self.force_fullscreen()
+    
     def create_new_tab_page(self):
-        browser = self.add_new_tab(QUrl('about:blank'), 'Loading...')
+        # WebEngine navigates the returned page to the popup target itself
+        browser = self.open_tab('Loading...')
         return browser.page()
     
     def update_tab_title(self, browser, title):
         index = self.tabs.indexOf(browser)
         if index != -1:
             current_url = browser.url().toString()
-            if current_url == 'https://ksjc.teleuniv.in' or current_url == 'https://ksjc.teleuniv.in/':
+            if current_url == HOME_URL or current_url == HOME_URL + '/':
                 self.tabs.setTabText(index, 'Home')
             else:
                 if title and title.strip() and title != 'about:blank':
@@ -668,30 +898,44 @@ class TeleBrowser(QMainWindow):
     
     def close_tab(self, index):
         if self.tabs.count() > 1:
+            browser = self.tabs.widget(index)
             self.tabs.removeTab(index)
+            self.release_tab(browser)
         else:
             self.statusBar().showMessage('Cannot close the last tab', 2000)
     
+    def release_tab(self, browser):
+        """Disconnect a removed tab and free its page and renderer process"""
+        if browser is None:
+            return
+        if self.tab_lifecycle:
+            self.tab_lifecycle.forget(browser)
+        if self.session_store:
+            self.session_store.forget(browser)
+        
+        # The titleChanged lambda holds a reference to the view
+        try:
+            browser.titleChanged.disconnect()
+        except TypeError:
+            pass
+        
+        page = browser.page()
+        if page is not None:
+            try:
+                page.loadFinished.disconnect()
+            except TypeError:
+                pass
+            page.triggerAction(QWebEnginePage.Stop)
+            # Deferred deletes run in posting order: page first, then view
+            page.deleteLater()
+        browser.deleteLater()
+    
     def current_browser(self):
         return self.tabs.currentWidget()
     
     def setupShortcuts(self):
         pass
     
-    def start_fullscreen_monitor(self):
-        """Start a timer that continuously monitors and enforces fullscreen mode"""
-        self.fullscreen_timer = QTimer()
-        self.fullscreen_timer.timeout.connect(self.enforce_fullscreen)
-        self.fullscreen_timer.start(500)  # Check every 500ms
-    
-    def enforce_fullscreen(self):
-        """Continuously enforce fullscreen mode"""
-        if not self.is_closing:
-            if not self.isFullScreen():
-                self.showFullScreen()
-                self.activateWindow()
-                self.raise_()
-    
     def keyPressEvent(self, event):
         # Block Escape key to prevent exiting fullscreen
         if event.key() == Qt.Key_Escape:
@@ -772,10 +1016,12 @@ class TeleBrowser(QMainWindow):
     def navigate_home(self):
         browser = self.current_browser()
         if browser:
-            browser.setUrl(QUrl('https://ksjc.teleuniv.in'))
+            browser.setUrl(QUrl(HOME_URL))
     
     def close_browser(self):
         self.is_closing = True
+        # The confirmation dialog must not lose focus to a re-assert
+        self.lockdown.suspend()
         
         reply = QMessageBox.question(self, 'Close Browser', 
                                      'Are you sure you want to close the browser?',
@@ -783,70 +1029,91 @@ class TeleBrowser(QMainWindow):
                                      QMessageBox.No)
         
         if reply == QMessageBox.Yes:
+            # Only a confirmed exit discards the session
+            if self.session_store:
+                self.session_store.stop(clean=True)
             self.close()
         else:
             self.is_closing = False
+            self.lockdown.resume()
     
     def closeEvent(self, event):
         if self.countdown_timer:
             self.countdown_timer.stop()
-        if self.fullscreen_timer:
-            self.fullscreen_timer.stop()
+        self.startup.stop()
+        self.lockdown.suspend()
+        if self.tab_lifecycle:
+            self.tab_lifecycle.stop()
+        if self.memory_monitor:
+            self.memory_monitor.stop()
+        if self.page_pool:
+            self.page_pool.clear()
+        if self.session_store:
+            # Also reached on OS logout or shutdown, where the session must
+            # survive; close_browser removes it on a confirmed exit
+            self.session_store.stop(clean=False)
+        if self.download_store:
+            self.download_store.stop()
+        if self.network_watcher:
+            self.network_watcher.stop()
+        print(cache_stats.summary())
         event.accept()
     
     def changeEvent(self, event):
         # Prevent window from being minimized and force back to fullscreen
         if event.type() == QEvent.WindowStateChange:
-            if self.windowState() & Qt.WindowMinimized:
-                # Force back to fullscreen immediately
-                QTimer.singleShot(0, self.force_fullscreen)
-                event.ignore()
-                return
-            elif not (self.windowState() & Qt.WindowFullScreen):
-                # If not in fullscreen for any reason, force it back
-                QTimer.singleShot(0, self.force_fullscreen)
+            if (self.windowState() & Qt.WindowMinimized or
+                    not (self.windowState() & Qt.WindowFullScreen)):
+                # Minimized or not fullscreen for any reason: force it back
+                self.force_fullscreen()
                 event.ignore()
                 return
         super().changeEvent(event)
     
-    def force_fullscreen(self):
-        """Force the window back to fullscreen mode"""
-        if not self.is_closing:
-            self.setWindowState(Qt.WindowFullScreen)
-            self.activateWindow()
-            self.raise_()
-            self.showFullScreen()
+    def force_fullscreen(self, delay=0):
+        """Ask the enforcer to restore fullscreen; repeated requests are coalesced"""
+        self.lockdown.request(delay)
     
     def showEvent(self, event):
         """Ensure fullscreen when window is shown"""
         super().showEvent(event)
-        if not self.is_closing:
-            QTimer.singleShot(100, self.force_fullscreen)
+        if not self.window_handle_watched:
+            self.window_handle_watched = self.lockdown.watch_window_handle()
+        self.force_fullscreen(100)
     
     def focusOutEvent(self, event):
         """Regain focus and fullscreen when focus is lost"""
         super().focusOutEvent(event)
-        if not self.is_closing:
-            QTimer.singleShot(200, self.force_fullscreen)
-    
-    def eventFilter(self, obj, event):
-        # Monitor for any window state changes globally
-        if event.type() == QEvent.WindowStateChange:
-            if not self.is_closing and not (self.windowState() & Qt.WindowFullScreen):
-                QTimer.singleShot(0, self.force_fullscreen)
-        return super().eventFilter(obj, event)
+        self.force_fullscreen(200)
 
 
 def main():
-    app = QApplication(sys.argv)
-    app.setApplicationName('Tele Browser')
+    # A second launch hands its arguments to the running instance and
+    # exits before any Chromium process is started
+    if single_instance.enabled() and single_instance.hand_off(sys.argv[1:]):
+        print("Tele Browser is already running; opened there")
+        sys.exit(0)
     
-    browser = TeleBrowser()
-    browser.showFullScreen()  # Open in full screen mode
-    browser.activateWindow()
-    browser.raise_()
+    # Chromium reads its flags when QtWebEngine starts with the application
+    chromium_flags.configure('lab')
+    with startup_trace.phase('QApplication'):
+        app = QApplication(sys.argv)
+        app.setApplicationName('Tele Browser')
+    splash = show_splash(app)
     
-    app.installEventFilter(browser)
+    # Only schedules the build; the window appears once its widgets exist
+    browser = TeleBrowser()
+    browser.show_over_splash(splash)
+    if single_instance.enabled():
+        # Without the guard the browser still runs; a later launch just
+        # starts its own instance
+        try:
+            instance_server = single_instance.InstanceServer(parent=browser)
+            instance_server.arguments_received.connect(browser.open_handed_over)
+            if not instance_server.listen():
+                print("Single-instance guard unavailable: {}".format(instance_server.server.errorString()))
+        except Exception as e:
+            print("Single-instance guard unavailable: {}".format(e))
     
     sys.exit(app.exec_())
 
@@ -4,13 +4,18 @@ import threading
 import sys
 import os
 import subprocess
-from PyQt5.QtCore import QUrl, Qt, QEvent, QStandardPaths, QTimer
+from PyQt5.QtCore import QUrl, Qt, QEvent, QStandardPaths, QTimer, QStringListModel
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, 
                              QHBoxLayout, QWidget, QLineEdit, QPushButton, 
-                             QToolBar, QAction, QMessageBox, QTabWidget, QTabBar)
-from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineSettings, QWebEngineProfile
+                             QToolBar, QAction, QMessageBox, QTabWidget, QTabBar,
+                             QCompleter)
+from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineProfile
 from PyQt5.QtGui import QIcon, QKeySequence
 from PyQt5.QtNetwork import QNetworkConfigurationManager
+from settings_presets import apply_preset
+from history_index import normalize
+from history_store import HistoryStore
+import chromium_flags
 
 # Before class definitions
 check_debugger()
@@ -129,6 +134,12 @@ class TeleBrowser(QMainWindow):
         self.warning_dialog = None
         self.network_manager = None
         self.is_closing = False  # Add flag to track closing state
+        # Web settings are inherited by every page from the profile
+        apply_preset(QWebEngineProfile.defaultProfile(), 'browse')
+        # Visited URLs for address bar suggestions, loaded in the background
+        self.history = HistoryStore(self)
+        self.history.start()
+        self.typed_views = set()  # views whose next load was typed in the address bar
         self.initUI()
         self.setupShortcuts()
         
@@ -200,6 +211,15 @@ class TeleBrowser(QMainWindow):
         self.url_bar.returnPressed.connect(self.navigate_to_url)
         nav_bar.addWidget(self.url_bar)
         
+        # History suggestions; the model is refilled from the index per keystroke
+        self.suggestions = QStringListModel(self)
+        self.completer = QCompleter(self.suggestions, self)
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.completer.setMaxVisibleItems(8)
+        self.completer.activated[str].connect(self.on_suggestion_activated)
+        self.url_bar.setCompleter(self.completer)
+        self.url_bar.textEdited.connect(self.update_suggestions)
+        
         # Go button
         self.go_btn = QPushButton('Go')
         self.go_btn.setFixedSize(50, 30)
@@ -252,6 +272,13 @@ class TeleBrowser(QMainWindow):
             return
         
         # Check if it's a valid URL or search query
+        if not url_text.startswith(('http://', 'https://', 'file://')):
+            # A URL typed without its scheme that is already in the history
+            # keeps the scheme it was visited with instead of guessing http://
+            best = self.history.suggest(url_text, 1)
+            if best and normalize(best[0].url).rstrip('/') == normalize(url_text).rstrip('/'):
+                url_text = best[0].url
+        
         if not url_text.startswith(('http://', 'https://', 'file://')):
             # Check if it looks like a domain (contains a dot and no spaces)
             if '.' in url_text and ' ' not in url_text:
@@ -262,9 +289,33 @@ class TeleBrowser(QMainWindow):
         
         browser = self.current_browser()
         if browser:
+            self.typed_views.add(browser)
             browser.setUrl(QUrl(url_text))
             browser.setFocus()
     
+    def update_suggestions(self, text):
+        """Refill the completer from the history index for the typed prefix"""
+        entries = self.history.suggest(text)
+        self.suggestions.setStringList([entry.url for entry in entries])
+        if entries:
+            self.completer.complete()
+        else:
+            self.completer.popup().hide()
+    
+    def on_suggestion_activated(self, url):
+        self.url_bar.setText(url)
+        self.navigate_to_url()
+    
+    def on_load_finished(self, browser, ok):
+        """Record successful page loads in the history"""
+        # The typed navigation ends with this load, wherever it redirected to
+        typed = browser in self.typed_views
+        self.typed_views.discard(browser)
+        url = browser.url()
+        if not ok or url.scheme() not in ('http', 'https', 'file'):
+            return
+        self.history.record_visit(url.toString(), browser.title(), typed)
+    
     def update_url_bar(self):
         """Update address bar when switching tabs"""
         browser = self.current_browser()
@@ -422,13 +473,6 @@ class TeleBrowser(QMainWindow):
         secure_page = SecureWebPage(browser, self)
         browser.setPage(secure_page)
         
-        # Disable developer tools and other features
-        settings = browser.settings()
-        settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
-        settings.setAttribute(QWebEngineSettings.PluginsEnabled, False)
-        settings.setAttribute(QWebEngineSettings.JavascriptCanAccessClipboard, False)
-        settings.setAttribute(QWebEngineSettings.ShowScrollBars, True)
-        
         browser.setUrl(qurl)
         
         # Disable context menu on browser
@@ -444,6 +488,9 @@ class TeleBrowser(QMainWindow):
         # Update URL bar when URL changes
         browser.urlChanged.connect(lambda qurl: self.url_bar.setText(qurl.toString()))
         
+        # Add finished loads to the history
+        browser.loadFinished.connect(lambda ok, browser=browser: self.on_load_finished(browser, ok))
+        
         # Update URL bar immediately
         self.url_bar.setText(qurl.toString())
         
@@ -476,6 +523,7 @@ class TeleBrowser(QMainWindow):
     def close_tab(self, index):
         """Close a tab"""
         if self.tabs.count() > 1:
+            self.typed_views.discard(self.tabs.widget(index))
             self.tabs.removeTab(index)
         else:
             # If it's the last tab, don't close it
@@ -587,6 +635,8 @@ class TeleBrowser(QMainWindow):
         # Stop timers if running
         if self.countdown_timer:
             self.countdown_timer.stop()
+        # Flush history writes still queued on the worker
+        self.history.stop()
         event.accept()
     
     def changeEvent(self, event):
@@ -624,6 +674,8 @@ class TeleBrowser(QMainWindow):
         return super().eventFilter(obj, event)
 
 def main():
+    # Chromium reads its flags when QtWebEngine starts with the application
+    chromium_flags.configure('default')
     app = QApplication(sys.argv)
     app.setApplicationName('Tele Browser')
     
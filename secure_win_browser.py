@@ -8,9 +8,11 @@ from PyQt5.QtCore import QUrl, Qt, QEvent, QStandardPaths, QTimer
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, 
                              QHBoxLayout, QWidget, QLineEdit, QPushButton, 
                              QToolBar, QAction, QMessageBox, QTabWidget, QTabBar)
-from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineSettings, QWebEngineProfile
+from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineProfile
 from PyQt5.QtGui import QIcon, QKeySequence
 from PyQt5.QtNetwork import QNetworkConfigurationManager
+from settings_presets import apply_preset
+import chromium_flags
 
 # Before class definitions
 check_debugger()
@@ -130,6 +132,8 @@ class TeleBrowser(QMainWindow):
         self.network_manager = None
         self.is_closing = False  # Add flag to track closing state
         self.allow_deactivate = False  # Flag to allow window deactivation
+        # Web settings are inherited by every page from the profile
+        apply_preset(QWebEngineProfile.defaultProfile(), 'strict-exam')
         self.initUI()
         self.setupShortcuts()
         
@@ -361,13 +365,6 @@ class TeleBrowser(QMainWindow):
         secure_page = SecureWebPage(browser, self)
         browser.setPage(secure_page)
         
-        # Disable developer tools and other features
-        settings = browser.settings()
-        settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
-        settings.setAttribute(QWebEngineSettings.PluginsEnabled, False)
-        settings.setAttribute(QWebEngineSettings.JavascriptCanAccessClipboard, False)
-        settings.setAttribute(QWebEngineSettings.ShowScrollBars, True)
-        
         browser.setUrl(qurl)
         
         # Disable context menu on browser
@@ -543,6 +540,8 @@ class TeleBrowser(QMainWindow):
         return super().eventFilter(obj, event)
 
 def main():
+    # Chromium reads its flags when QtWebEngine starts with the application
+    chromium_flags.configure('default')
     app = QApplication(sys.argv)
     app.setApplicationName('Tele Browser')
     
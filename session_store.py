@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Crash-safe session snapshots and lazy tab restore for Tele Browser
+
+Session file layout (zlib compressed after the header):
+    header:  b'TBS1'
+    payload: active index (H), tab count (H), then per tab
+             url (I + utf-8), title (I + utf-8), scroll x/y (2 x d),
+             navigation history (I + QDataStream bytes)
+"""
+
+import os
+import struct
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, QTimer, QByteArray, QDataStream, QIODevice, QStandardPaths, QUrl
+
+MAGIC = b'TBS1'
+SESSION_FILE = 'session.bin'
+SNAPSHOT_INTERVAL_MS = int(os.environ.get('TELEBROWSER_SESSION_INTERVAL_MS', '30000'))
+
+
+def pack_bytes(data):
+    return struct.pack('<I', len(data)) + data
+
+
+def unpack_bytes(payload, offset):
+    (length,) = struct.unpack_from('<I', payload, offset)
+    offset += 4
+    return payload[offset:offset + length], offset + length
+
+
+def encode_session(active, records):
+    parts = [struct.pack('<HH', active, len(records))]
+    for record in records:
+        parts.append(pack_bytes(record['url'].encode('utf-8')))
+        parts.append(pack_bytes(record['title'].encode('utf-8')))
+        parts.append(struct.pack('<dd', record['scroll_x'], record['scroll_y']))
+        parts.append(pack_bytes(record['history']))
+    return MAGIC + zlib.compress(b''.join(parts))
+
+
+def decode_session(data):
+    if not data.startswith(MAGIC):
+        raise ValueError('not a session file')
+    payload = zlib.decompress(data[len(MAGIC):])
+    active, count = struct.unpack_from('<HH', payload, 0)
+    offset = 4
+    records = []
+    for _ in range(count):
+        url, offset = unpack_bytes(payload, offset)
+        title, offset = unpack_bytes(payload, offset)
+        scroll_x, scroll_y = struct.unpack_from('<dd', payload, offset)
+        offset += 16
+        history, offset = unpack_bytes(payload, offset)
+        records.append({
+            'url': url.decode('utf-8'),
+            'title': title.decode('utf-8'),
+            'scroll_x': scroll_x,
+            'scroll_y': scroll_y,
+            'history': history,
+        })
+    return active, records
+
+
+def write_atomic(path, data):
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class SessionStore(QObject):
+    """
+    Periodically snapshots the open tabs and restores them after a crash.
+    Tab state is collected on the GUI thread; encoding and the atomic
+    write happen on a single background worker.
+    """
+    def __init__(self, tabs, parent=None):
+        super().__init__(parent)
+        self.tabs = tabs
+        session_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        if not os.path.exists(session_dir):
+            os.makedirs(session_dir)
+        self.path = os.path.join(session_dir, SESSION_FILE)
+        self.pending = {}  # view -> record not yet loaded (lazy restore)
+        self.last_written = None
+        self.writer = ThreadPoolExecutor(max_workers=1)
+
+        self.tabs.currentChanged.connect(self.on_current_changed)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.snapshot)
+
+    def start(self):
+        self.timer.start(SNAPSHOT_INTERVAL_MS)
+
+    def stop(self, clean=True):
+        """Stop snapshotting; a clean exit removes the session file"""
+        self.timer.stop()
+        self.writer.shutdown(wait=True)
+        if clean:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def capture(self, view):
+        if view in self.pending:
+            return self.pending[view]
+
+        history = QByteArray()
+        stream = QDataStream(history, QIODevice.WriteOnly)
+        stream << view.history()
+        scroll = view.page().scrollPosition()
+        return {
+            'url': view.url().toString(),
+            'title': view.title(),
+            'scroll_x': scroll.x(),
+            'scroll_y': scroll.y(),
+            'history': bytes(history),
+        }
+
+    def snapshot(self):
+        records = [self.capture(self.tabs.widget(i)) for i in range(self.tabs.count())]
+        active = max(self.tabs.currentIndex(), 0)
+        self.writer.submit(self.write, active, records)
+
+    def write(self, active, records):
+        try:
+            data = encode_session(active, records)
+            if data == self.last_written:
+                return
+            write_atomic(self.path, data)
+            self.last_written = data
+        except OSError as e:
+            print("Session snapshot failed: {}".format(e), file=sys.stderr)
+
+    def load(self):
+        try:
+            with open(self.path, 'rb') as f:
+                return decode_session(f.read())
+        except (OSError, ValueError, struct.error, zlib.error):
+            return None
+
+    def restore(self, open_tab):
+        """
+        Recreate the saved tabs through open_tab(label). Only the active tab
+        loads now; the others load when they are first activated.
+        Returns False if there was no session to restore.
+        """
+        session = self.load()
+        if not session or not session[1]:
+            return False
+
+        active, records = session
+        active = min(active, len(records) - 1)
+        views = []
+        for record in records:
+            view = open_tab(record['title'] or 'Tab')
+            self.pending[view] = record
+            views.append(view)
+
+        self.tabs.setCurrentWidget(views[active])
+        self.apply(views[active])
+        print("Restored session with {} tabs".format(len(records)))
+        return True
+
+    def on_current_changed(self, index):
+        view = self.tabs.widget(index)
+        if view in self.pending:
+            self.apply(view)
+
+    def apply(self, view):
+        """Load a lazily restored tab: history first, then scroll position"""
+        record = self.pending.pop(view, None)
+        if record is None:
+            return
+
+        if record['history']:
+            stream = QDataStream(QByteArray(record['history']), QIODevice.ReadOnly)
+            stream >> view.history()
+        if not view.url().isValid() or view.url().isEmpty():
+            view.setUrl(QUrl(record['url']))
+
+        if record['scroll_x'] or record['scroll_y']:
+            script = 'window.scrollTo({}, {});'.format(record['scroll_x'], record['scroll_y'])
+
+            def restore_scroll(ok, view=view):
+                view.loadFinished.disconnect(restore_scroll)
+                if ok:
+                    view.page().runJavaScript(script)
+            view.loadFinished.connect(restore_scroll)
+
+    def forget(self, view):
+        self.pending.pop(view, None)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Named QWebEngineSettings presets applied once at the profile level
+"""
+
+import os
+import sys
+from PyQt5.QtWebEngineWidgets import QWebEngineSettings
+
+S = QWebEngineSettings
+
+BROWSE = {
+    S.JavascriptEnabled: True,
+    S.PluginsEnabled: False,
+    S.JavascriptCanAccessClipboard: False,
+    S.ShowScrollBars: True,
+}
+
+STRICT_EXAM = dict(BROWSE)
+STRICT_EXAM.update({
+    S.AllowRunningInsecureContent: False,
+    S.LocalContentCanAccessRemoteUrls: False,
+    S.FullScreenSupportEnabled: False,
+    S.HyperlinkAuditingEnabled: False,
+})
+
+# For weak lab hardware: drop GPU-heavy and purely cosmetic features
+LOW_RESOURCE = dict(STRICT_EXAM)
+LOW_RESOURCE.update({
+    S.WebGLEnabled: False,
+    S.Accelerated2dCanvasEnabled: False,
+    S.ScrollAnimatorEnabled: False,
+    S.PlaybackRequiresUserGesture: True,
+    S.AutoLoadIconsForPage: False,
+    S.TouchIconsEnabled: False,
+    S.PdfViewerEnabled: False,
+})
+
+PRESETS = {
+    'browse': BROWSE,
+    'strict-exam': STRICT_EXAM,
+    'low-resource': LOW_RESOURCE,
+}
+
+
+def preset_name(default):
+    """Preset selected for this deployment (TELEBROWSER_SETTINGS_PRESET)"""
+    name = os.environ.get('TELEBROWSER_SETTINGS_PRESET', default)
+    if name not in PRESETS:
+        print("Unknown settings preset '{}', using '{}'".format(name, default), file=sys.stderr)
+        return default
+    return name
+
+
+def apply_preset(profile, default='strict-exam'):
+    """
+    Apply a preset to the profile's settings. Pages created on the profile
+    inherit these values unless they override an attribute themselves.
+    """
+    name = preset_name(default)
+    settings = profile.settings()
+    for attribute, enabled in PRESETS[name].items():
+        settings.setAttribute(attribute, enabled)
+    print("Settings preset: {}".format(name))
+    return name
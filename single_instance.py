@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Single-instance guard for Tele Browser
+
+The first instance listens on a per-user local socket. A later launch
+connects to it, hands over its command-line arguments and exits before
+QtWebEngine starts, so no second Chromium stack or fullscreen window is
+created. The running instance opens the handed-over URLs in new tabs.
+"""
+
+import json
+import os
+from PyQt5.QtCore import QObject, QUrl, pyqtSignal
+from PyQt5.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+# Overridable so benchmarks can run next to a real instance
+SERVER_NAME = os.environ.get('TELEBROWSER_INSTANCE', 'telebrowser-{}'.format(
+    os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')))
+HANDOFF_TIMEOUT_MS = 1000
+MAX_MESSAGE = 64 * 1024
+
+
+def origin(url):
+    """(scheme, host, port) of an http(s) QUrl"""
+    default_port = 443 if url.scheme() == 'https' else 80
+    return url.scheme(), url.host().lower(), url.port(default_port)
+
+
+def allowed_url(arg, origins):
+    """
+    QUrl for a handed-over argument if it is an http(s) URL on one of the
+    allowed origins, else None. Any local process can connect to the
+    socket, so file:// paths and other sites are never opened.
+    """
+    url = QUrl(arg, QUrl.StrictMode)
+    if not url.isValid() or url.scheme() not in ('http', 'https'):
+        return None
+    allowed = {origin(QUrl(o)) for o in origins}
+    return url if origin(url) in allowed else None
+
+
+def enabled():
+    return os.environ.get('TELEBROWSER_SINGLE_INSTANCE', '1') != '0'
+
+
+def hand_off(args, name=SERVER_NAME, timeout_ms=HANDOFF_TIMEOUT_MS):
+    """
+    Send args to a running instance. Returns True once it has acknowledged
+    them, False if no instance is listening. Works before QApplication exists.
+    """
+    sock = QLocalSocket()
+    sock.connectToServer(name)
+    if not sock.waitForConnected(timeout_ms):
+        return False
+    try:
+        sock.write(json.dumps({'args': list(args)}).encode('utf-8') + b'\n')
+        if not sock.waitForBytesWritten(timeout_ms):
+            return False
+        # Wait for the ack so the caller only exits once the tab is requested
+        while not sock.canReadLine():
+            if not sock.waitForReadyRead(timeout_ms):
+                return False
+        return bytes(sock.readLine()).strip() == b'ok'
+    finally:
+        sock.disconnectFromServer()
+
+
+class InstanceServer(QObject):
+    """Receives argument lists from later launches"""
+    arguments_received = pyqtSignal(list)
+
+    def __init__(self, name=SERVER_NAME, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self.on_new_connection)
+        self.buffers = {}
+
+    def listen(self):
+        """Start listening; a socket left behind by a crashed instance is replaced"""
+        if self.server.listen(self.name):
+            return True
+        if self.server.serverError() != QAbstractSocket.AddressInUseError:
+            return False
+        # Only remove the socket if nobody answers on it
+        probe = QLocalSocket()
+        probe.connectToServer(self.name)
+        if probe.waitForConnected(HANDOFF_TIMEOUT_MS):
+            probe.abort()
+            return False
+        QLocalServer.removeServer(self.name)
+        return self.server.listen(self.name)
+
+    def stop(self):
+        self.server.close()
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            sock = self.server.nextPendingConnection()
+            self.buffers[sock] = b''
+            sock.readyRead.connect(lambda sock=sock: self.on_ready_read(sock))
+            sock.disconnected.connect(lambda sock=sock: self.on_disconnected(sock))
+
+    def on_ready_read(self, sock):
+        data = self.buffers.get(sock, b'') + bytes(sock.readAll())
+        if b'\n' not in data:
+            if len(data) > MAX_MESSAGE:
+                sock.abort()
+            else:
+                self.buffers[sock] = data
+            return
+
+        line = data.split(b'\n', 1)[0]
+        self.buffers[sock] = b''
+        try:
+            args = json.loads(line.decode('utf-8'))['args']
+        except (ValueError, KeyError, TypeError):
+            sock.abort()
+            return
+        sock.write(b'ok\n')
+        sock.flush()
+        self.arguments_received.emit([str(arg) for arg in args])
+        sock.disconnectFromServer()
+
+    def on_disconnected(self, sock):
+        self.buffers.pop(sock, None)
+        sock.deleteLater()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Splash-first staged startup for Tele Browser
+
+A plain fullscreen splash is painted before QtWebEngine is touched. The
+browser is then built one step per event-loop turn, so the splash keeps
+repainting and the first pixel does not wait for Chromium, the widgets
+and the first tab.
+"""
+
+from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QPixmap
+from PyQt5.QtWidgets import QSplashScreen
+
+import startup_trace
+
+SPLASH_COLOR = '#263238'
+
+
+def show_splash(app, text='Tele Browser\n\nStarting...'):
+    """Paint a fullscreen splash right away; returns it for finish()"""
+    with startup_trace.phase('splash'):
+        pixmap = QPixmap(app.primaryScreen().size())
+        pixmap.fill(QColor(SPLASH_COLOR))
+        splash = QSplashScreen(pixmap, Qt.WindowStaysOnTopHint)
+        splash.showMessage(text, Qt.AlignCenter, Qt.white)
+        splash.showFullScreen()
+        app.processEvents()
+    startup_trace.mark('first pixel')
+    return splash
+
+
+class StartupSequence(QObject):
+    """
+    Runs named steps on consecutive event-loop turns. Each step is traced
+    as a startup phase; progressed is emitted after every step and
+    finished after the last one.
+    """
+    progressed = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(self, steps, parent=None):
+        super().__init__(parent)
+        self.steps = list(steps)
+        self.done = False
+        self.stopped = False
+
+    def start(self):
+        QTimer.singleShot(0, self.run_next)
+
+    def stop(self):
+        """Abandon the remaining steps, e.g. when the window closes early"""
+        self.stopped = True
+
+    def run_next(self):
+        if self.stopped:
+            return
+        if not self.steps:
+            self.done = True
+            self.finished.emit()
+            return
+
+        name, step = self.steps.pop(0)
+        with startup_trace.phase(name):
+            step()
+        self.progressed.emit(name)
+        QTimer.singleShot(0, self.run_next)
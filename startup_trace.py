@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Startup timeline tracing for Tele Browser
+
+Timestamps startup phases on the monotonic clock, relative to the moment
+the process was created. A one-line summary is always printed when the
+home page has loaded; the full timeline is written as a Chrome trace
+(chrome://tracing, Perfetto) when TELEBROWSER_STARTUP_TRACE=<file> or
+--startup-trace=<file> is given.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+def since_process_start():
+    """Seconds between process creation and now (Linux), else 0"""
+    try:
+        with open('/proc/self/stat') as f:
+            start_ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf('SC_CLK_TCK'))
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+_origin = time.monotonic() - since_process_start()
+_events = []
+_lock = threading.Lock()
+_finished = False
+
+
+def trace_path():
+    for arg in sys.argv[1:]:
+        if arg.startswith('--startup-trace='):
+            return arg.split('=', 1)[1]
+    return os.environ.get('TELEBROWSER_STARTUP_TRACE')
+
+
+def now():
+    return time.monotonic()
+
+
+def add_span(name, start, end):
+    """Record a phase that ran from start to end (monotonic seconds); thread-safe"""
+    with _lock:
+        _events.append({
+            'name': name, 'ph': 'X',
+            'ts': (start - _origin) * 1e6, 'dur': (end - start) * 1e6,
+            'pid': os.getpid(), 'tid': threading.get_ident(),
+        })
+
+
+def mark(name):
+    """Record an instant in the timeline"""
+    with _lock:
+        _events.append({
+            'name': name, 'ph': 'i', 's': 'p',
+            'ts': (now() - _origin) * 1e6,
+            'pid': os.getpid(), 'tid': threading.get_ident(),
+        })
+
+
+@contextmanager
+def phase(name):
+    start = now()
+    try:
+        yield
+    finally:
+        add_span(name, start, now())
+
+
+def summary():
+    """key=value line with the duration of every top-level phase in ms"""
+    with _lock:
+        events = list(_events)
+    parts = ['total={:.0f}ms'.format((now() - _origin) * 1000)]
+    for event in events:
+        key = event['name'].replace(' ', '_')
+        if event['ph'] == 'X':
+            parts.append('{}={:.0f}ms'.format(key, event['dur'] / 1000))
+        else:
+            parts.append('{}@{:.0f}ms'.format(key, event['ts'] / 1000))
+    return 'startup: ' + ' '.join(parts)
+
+
+def finish(name='home loaded'):
+    """Close the timeline once; later calls are ignored"""
+    global _finished
+    if _finished:
+        return
+    _finished = True
+    mark(name)
+    print(summary(), file=sys.stderr)
+
+    path = trace_path()
+    if not path:
+        return
+    with _lock:
+        trace = {'traceEvents': list(_events), 'displayTimeUnit': 'ms'}
+    try:
+        with open(path, 'w') as f:
+            json.dump(trace, f)
+    except OSError as e:
+        print("Startup trace not written: {}".format(e), file=sys.stderr)
+
+
+# Everything before this module was imported: exec, interpreter and site setup
+add_span('interpreter', _origin, now())
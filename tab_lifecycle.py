@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Background tab freezing and discarding for Tele Browser
+"""
+
+import os
+import time
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+
+# Seconds a background tab may stay idle before it is frozen
+FREEZE_AFTER = int(os.environ.get('TELEBROWSER_FREEZE_AFTER', '300'))
+# Discard frozen tabs while available system memory is below this (MB)
+DISCARD_BELOW_MB = int(os.environ.get('TELEBROWSER_DISCARD_BELOW_MB', '512'))
+CHECK_INTERVAL_MS = 15000
+
+
+class TabLifecycleManager(QObject):
+    """
+    Moves background tabs through the QWebEnginePage lifecycle states.
+    Idle tabs are frozen, frozen tabs are discarded under memory pressure
+    and any tab is brought back to Active (reloading it if it was
+    discarded) when it becomes the current tab again.
+    """
+    def __init__(self, tabs, parent=None):
+        super().__init__(parent)
+        self.tabs = tabs
+        self.last_active = {}  # view -> monotonic time it was last current
+        self.tabs.currentChanged.connect(self.on_current_changed)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check)
+        self.timer.start(CHECK_INTERVAL_MS)
+
+    def stop(self):
+        self.timer.stop()
+
+    def views(self):
+        return [self.tabs.widget(i) for i in range(self.tabs.count())]
+
+    def on_current_changed(self, index):
+        """Reactivate the tab the user switched to"""
+        now = time.monotonic()
+        previous = [v for v in self.last_active if self.last_active[v] is None]
+        for view in previous:
+            self.last_active[view] = now
+
+        view = self.tabs.widget(index)
+        if view is None:
+            return
+        self.last_active[view] = None  # None marks the current tab
+        page = view.page()
+        if page.lifecycleState() != QWebEnginePage.LifecycleState.Active:
+            page.setLifecycleState(QWebEnginePage.LifecycleState.Active)
+
+    def forget(self, view):
+        self.last_active.pop(view, None)
+
+    def memory_pressure(self):
+        import psutil  # Only needed once tabs start aging
+        available_mb = psutil.virtual_memory().available / (1024 * 1024)
+        return available_mb < DISCARD_BELOW_MB
+
+    def discard(self, view):
+        """Drop the renderer state of a background tab; it reloads on activation"""
+        if view is self.tabs.currentWidget():
+            return False
+        page = view.page()
+        if page.lifecycleState() == QWebEnginePage.LifecycleState.Discarded:
+            return False
+        page.setLifecycleState(QWebEnginePage.LifecycleState.Discarded)
+        return True
+
+    def check(self):
+        """Freeze idle background tabs and discard them if memory is low"""
+        live = self.views()
+        for view in list(self.last_active):
+            if view not in live:
+                self.forget(view)
+
+        now = time.monotonic()
+        current = self.tabs.currentWidget()
+        background = []
+        for view in live:
+            if view is current:
+                continue
+            idle_since = self.last_active.setdefault(view, now)
+            if idle_since is None:
+                idle_since = self.last_active[view] = now
+            background.append((idle_since, view))
+
+        for idle_since, view in background:
+            page = view.page()
+            if (now - idle_since >= FREEZE_AFTER and
+                    page.lifecycleState() == QWebEnginePage.LifecycleState.Active):
+                page.setLifecycleState(QWebEnginePage.LifecycleState.Frozen)
+
+        if not self.memory_pressure():
+            return
+
+        # Least recently used tabs go first
+        for idle_since, view in sorted(background, key=lambda item: item[0]):
+            if self.discard(view):
+                print("Discarded background tab: {}".format(view.url().toString()))
+            if not self.memory_pressure():
+                break
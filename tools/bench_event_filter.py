@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Per-event dispatch cost of an application-wide Python event filter
+
+Compares delivering a burst of events with no filter, with the old
+application-wide TeleBrowser.eventFilter and with the window-scoped
+QWindow.windowStateChanged hook that replaced it.
+
+Usage: QT_QPA_PLATFORM=offscreen python3 tools/bench_event_filter.py [events]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import QCoreApplication, QEvent, QObject, Qt
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget
+
+EVENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+
+class AppWideFilter(QObject):
+    """Same shape as the removed TeleBrowser.eventFilter"""
+    def __init__(self, window):
+        super().__init__()
+        self.window = window
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.WindowStateChange:
+            if not (self.window.windowState() & Qt.WindowFullScreen):
+                pass
+        return super().eventFilter(obj, event)
+
+
+def dispatch(target, count):
+    """Send count events synchronously and return nanoseconds per event"""
+    start = time.perf_counter()
+    for _ in range(count):
+        QCoreApplication.sendEvent(target, QEvent(QEvent.User))
+    return (time.perf_counter() - start) * 1e9 / count
+
+
+def main():
+    app = QApplication(sys.argv)
+    window = QMainWindow()
+    child = QWidget(window)
+    window.show()
+
+    # Warm up
+    dispatch(child, 1000)
+
+    results = {'none': dispatch(child, EVENTS)}
+
+    app_filter = AppWideFilter(window)
+    app.installEventFilter(app_filter)
+    results['app-wide'] = dispatch(child, EVENTS)
+    app.removeEventFilter(app_filter)
+
+    window.windowHandle().windowStateChanged.connect(lambda state: None)
+    results['window-hook'] = dispatch(child, EVENTS)
+
+    for name, ns in results.items():
+        print('{:12s} {:8.0f} ns/event'.format(name, ns))
+    print('app-wide filter overhead: {:.0f} ns/event'.format(results['app-wide'] - results['none']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Address bar history benchmark
+
+Fills a HistoryIndex with synthetic visits spread over a few hundred
+hosts, then measures suggestion latency for every prefix of a set of
+typed strings (one lookup per simulated keystroke) and the cost of
+loading the same history back from its journal. Results are printed as
+JSON (and written to --output) so runs can be compared.
+
+Usage: python3 tools/bench_history.py [--entries 50000] [--output history.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from history_index import HistoryIndex, entry_record, load_lines, visit_record
+
+WORDS = ['exam', 'course', 'results', 'login', 'notes', 'lab', 'assignment', 'docs', 'page', 'view']
+TYPED = ['e', 'exam.tele', 'site1', 'site12', 'docs.py', 'https://www.site3', 'mail.example.org/n', 'zzz']
+
+
+def synthetic_visits(count, seed):
+    rng = random.Random(seed)
+    hosts = ['exam.teleuniv.in', 'docs.python.org', 'mail.example.org'] + ['site{}.com'.format(i) for i in range(300)]
+    now = time.time()
+    for _ in range(count):
+        path = '/'.join(rng.choice(WORDS) + str(rng.randint(0, 500)) for _ in range(rng.randint(1, 3)))
+        url = '{}://{}{}/{}'.format(rng.choice(['http', 'https']), rng.choice(['', 'www.']), rng.choice(hosts), path)
+        yield url, path, now - rng.random() * 90 * 86400, rng.random() < 0.1
+
+
+def keystrokes():
+    for text in TYPED:
+        for end in range(1, len(text) + 1):
+            yield text[:end]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Address bar history benchmark')
+    parser.add_argument('--entries', type=int, default=50000, help='visits to record')
+    parser.add_argument('--rounds', type=int, default=200, help='times to replay all keystrokes')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='also write the JSON result to this file')
+    args = parser.parse_args()
+
+    visits = list(synthetic_visits(args.entries, args.seed))
+    index = HistoryIndex()
+    start = time.perf_counter()
+    for visit in visits:
+        index.visit(*visit)
+    build_s = time.perf_counter() - start
+
+    prefixes = list(keystrokes())
+    samples = []
+    for _ in range(args.rounds):
+        for prefix in prefixes:
+            start = time.perf_counter()
+            index.suggest(prefix)
+            samples.append(time.perf_counter() - start)
+    samples.sort()
+
+    journal = [visit_record(*visit) for visit in visits]
+    start = time.perf_counter()
+    load_lines(journal)
+    journal_load_s = time.perf_counter() - start
+
+    compacted = [entry_record(entry) for entry in index.entries.values()]
+    start = time.perf_counter()
+    load_lines(compacted)
+    compacted_load_s = time.perf_counter() - start
+
+    result = {
+        'visits': len(visits),
+        'urls': len(index),
+        'build_ms': round(build_s * 1000, 1),
+        'suggest_us': {
+            'median': round(statistics.median(samples) * 1e6, 2),
+            'p99': round(samples[int(len(samples) * 0.99)] * 1e6, 2),
+            'max': round(samples[-1] * 1e6, 2),
+        },
+        'journal_load_ms': round(journal_load_s * 1000, 1),
+        'compacted_load_ms': round(compacted_load_s * 1000, 1),
+    }
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
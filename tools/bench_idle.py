@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Idle cost benchmark for the Tele Browser shell
+
+Starts secure_browser.py under the offscreen platform against a local
+static page, lets it settle, then measures CPU usage, context switches
+and wakeups of the whole process tree over a fixed window. Results are
+printed as JSON (and written to --output) so runs can be compared.
+
+Wakeups are counted as voluntary context switches: every time a thread
+sleeps on a timer, poll or lock and is woken up again it makes one.
+
+Usage: python3 tools/bench_idle.py [--warmup 15] [--window 30] [--output idle.json]
+"""
+
+import argparse
+import functools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import psutil
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGE = '<!DOCTYPE html><html><head><title>Idle</title></head><body><p>idle benchmark</p></body></html>'
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_static(directory):
+    with open(os.path.join(directory, 'index.html'), 'w') as f:
+        f.write(PAGE)
+    handler = functools.partial(QuietHandler, directory=directory)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def thread_stats(pid):
+    """Per-thread (name, cpu seconds, voluntary, involuntary switches) from /proc"""
+    stats = {}
+    task_dir = '/proc/{}/task'.format(pid)
+    try:
+        tids = os.listdir(task_dir)
+    except OSError:
+        return stats
+    ticks = os.sysconf('SC_CLK_TCK')
+    for tid in tids:
+        try:
+            with open(os.path.join(task_dir, tid, 'comm')) as f:
+                name = f.read().strip()
+            with open(os.path.join(task_dir, tid, 'stat')) as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+            cpu = (int(fields[11]) + int(fields[12])) / ticks
+            voluntary = involuntary = 0
+            with open(os.path.join(task_dir, tid, 'status')) as f:
+                for line in f:
+                    if line.startswith('voluntary_ctxt_switches:'):
+                        voluntary = int(line.split()[1])
+                    elif line.startswith('nonvoluntary_ctxt_switches:'):
+                        involuntary = int(line.split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        stats['{}:{}'.format(pid, tid)] = (name, cpu, voluntary, involuntary)
+    return stats
+
+
+def tree_stats(proc):
+    stats = {}
+    try:
+        procs = [proc] + proc.children(recursive=True)
+    except psutil.Error:
+        procs = [proc]
+    for p in procs:
+        stats.update(thread_stats(p.pid))
+    return stats
+
+
+def measure(proc, window):
+    before = tree_stats(proc)
+    time.sleep(window)
+    after = tree_stats(proc)
+
+    per_name = {}
+    totals = {'cpu_seconds': 0.0, 'voluntary': 0, 'involuntary': 0}
+    for key, (name, cpu, voluntary, involuntary) in after.items():
+        _, cpu0, voluntary0, involuntary0 = before.get(key, (name, 0.0, 0, 0))
+        delta = (cpu - cpu0, voluntary - voluntary0, involuntary - involuntary0)
+        entry = per_name.setdefault(name, {'cpu_seconds': 0.0, 'voluntary': 0, 'involuntary': 0})
+        for field, value in zip(('cpu_seconds', 'voluntary', 'involuntary'), delta):
+            entry[field] += value
+            totals[field] += value
+
+    threads = sorted(
+        ({'thread': name,
+          'cpu_percent': round(100 * v['cpu_seconds'] / window, 3),
+          'wakeups_per_sec': round(v['voluntary'] / window, 2)}
+         for name, v in per_name.items()),
+        key=lambda t: t['wakeups_per_sec'], reverse=True)
+
+    return {
+        'window_seconds': window,
+        'processes': 1 + len(proc.children(recursive=True)),
+        'cpu_percent': round(100 * totals['cpu_seconds'] / window, 3),
+        'context_switches_per_sec': round((totals['voluntary'] + totals['involuntary']) / window, 2),
+        'wakeups_per_sec': round(totals['voluntary'] / window, 2),
+        'threads': threads,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Idle CPU and wakeup benchmark')
+    parser.add_argument('--warmup', type=float, default=15, help='seconds to let the page load and settle')
+    parser.add_argument('--window', type=float, default=30, help='measurement window in seconds')
+    parser.add_argument('--output', help='also write the JSON result to this file')
+    parser.add_argument('--script', default='secure_browser.py', help='browser entry point to measure')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work:
+        site = os.path.join(work, 'site')
+        os.makedirs(site)
+        server = serve_static(site)
+
+        env = dict(os.environ)
+        env.update({
+            'QT_QPA_PLATFORM': 'offscreen',
+            'TELEBROWSER_HOME_URL': 'http://127.0.0.1:{}/'.format(server.server_port),
+            # Keep profile, cache and session files out of the real user dirs
+            'XDG_DATA_HOME': os.path.join(work, 'data'),
+            'XDG_CACHE_HOME': os.path.join(work, 'cache'),
+            'XDG_CONFIG_HOME': os.path.join(work, 'config'),
+            # Do not hand off to a browser the user already has open
+            'TELEBROWSER_SINGLE_INSTANCE': '0',
+        })
+        child = subprocess.Popen([sys.executable, os.path.join(ROOT, args.script)],
+                                 cwd=ROOT, env=env,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            time.sleep(args.warmup)
+            if child.poll() is not None:
+                print('Browser exited during warmup (code {})'.format(child.returncode), file=sys.stderr)
+                sys.exit(1)
+            result = measure(psutil.Process(child.pid), args.window)
+        finally:
+            child.terminate()
+            try:
+                child.wait(10)
+            except subprocess.TimeoutExpired:
+                child.kill()
+            server.shutdown()
+
+    result['script'] = args.script
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Startup import-time benchmark for Tele Browser
+
+Runs the top-level import statements of the browser entry point (and
+nothing else: no anti-debug checks, no window) under `python -X importtime`
+in a fresh interpreter, several times, and reports the median cumulative
+import time plus the slowest modules. Results are printed as JSON (and
+written to --output) so runs can be compared.
+
+Exits non-zero if a module that should only load on first use shows up
+in the startup graph, or if the median exceeds --budget-ms, so the
+script can guard against import regressions.
+
+Usage: python3 tools/bench_imports.py [--runs 5] [--budget-ms 400] [--output imports.json]
+"""
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded on first use by later startup steps or fallbacks; never at import
+DEFERRED = [
+    'psutil',
+    'platform',
+    'subprocess',
+    'download_manager',
+    'download_store',
+    'network_watcher',
+]
+
+
+def startup_imports(path):
+    """Source of the module-level import statements of a script"""
+    with open(path) as f:
+        source = f.read()
+    tree = ast.parse(source, path)
+    statements = [ast.get_source_segment(source, node) for node in tree.body
+                  if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return '\n'.join(statements)
+
+
+def parse_importtime(stderr):
+    """Map of module -> (self us, cumulative us, depth) from -X importtime output"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            depth = (len(name) - len(name.lstrip())) // 2
+            modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+        except ValueError:
+            continue
+    return modules
+
+
+def run_once(code, env):
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=ROOT, env=env, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, universal_newlines=True)
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        sys.exit('import run failed (code {})'.format(result.returncode))
+    return parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Startup import-time benchmark')
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters to measure')
+    parser.add_argument('--top', type=int, default=15, help='slowest modules to list')
+    parser.add_argument('--budget-ms', type=float, help='fail if the median total exceeds this')
+    parser.add_argument('--output', help='also write the JSON result to this file')
+    parser.add_argument('--script', default='secure_browser.py', help='browser entry point to measure')
+    args = parser.parse_args()
+
+    code = startup_imports(os.path.join(ROOT, args.script))
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+
+    # First run only warms the OS page cache and __pycache__
+    run_once(code, env)
+    runs = [run_once(code, env) for _ in range(args.runs)]
+
+    totals = [sum(cumulative for _, cumulative, depth in modules.values() if depth == 0)
+              for modules in runs]
+    last = runs[-1]
+    slowest = sorted(last.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+    deferred_loaded = [name for name in DEFERRED if name in last]
+
+    result = {
+        'script': args.script,
+        'runs': args.runs,
+        'median_ms': round(statistics.median(totals) / 1000, 1),
+        'min_ms': round(min(totals) / 1000, 1),
+        'modules': len(last),
+        'slowest_self_ms': [{'module': name, 'self_ms': round(s / 1000, 2), 'cumulative_ms': round(c / 1000, 2)}
+                            for name, (s, c, _) in slowest],
+        'deferred_loaded_at_startup': deferred_loaded,
+    }
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+    failed = False
+    if deferred_loaded:
+        print('FAIL: loaded at startup but should load on first use: {}'.format(', '.join(deferred_loaded)),
+              file=sys.stderr)
+        failed = True
+    if args.budget_ms is not None and result['median_ms'] > args.budget_ms:
+        print('FAIL: median {} ms exceeds budget {} ms'.format(result['median_ms'], args.budget_ms),
+              file=sys.stderr)
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
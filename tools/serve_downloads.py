@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Local HTTP server for exercising the download manager
+
+Serves generated files at /file/<size_mb>.bin with a bandwidth limit and
+can drop the connection part way through to simulate a network flap.
+
+Usage: python3 tools/serve_downloads.py [--port 8765] [--rate-kb 512] [--drop-after-mb 5]
+Then open http://127.0.0.1:8765/file/20.bin in the browser.
+"""
+
+import argparse
+import hashlib
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CHUNK = 64 * 1024
+
+
+def file_bytes(size):
+    """Deterministic content so repeated downloads hash identically"""
+    block = hashlib.sha256(b'telebrowser').digest() * (CHUNK // 32)
+    full, rest = divmod(size, CHUNK)
+    for _ in range(full):
+        yield block
+    if rest:
+        yield block[:rest]
+
+
+class DownloadHandler(BaseHTTPRequestHandler):
+    rate = 512 * 1024
+    drop_after = 0
+    served = {}  # path -> number of requests seen
+
+    def do_GET(self):
+        parts = self.path.strip('/').split('/')
+        if len(parts) != 2 or parts[0] != 'file' or not parts[1].endswith('.bin'):
+            self.send_error(404)
+            return
+        try:
+            size = int(float(parts[1][:-4]) * 1024 * 1024)
+        except ValueError:
+            self.send_error(400)
+            return
+
+        attempt = self.served.get(self.path, 0)
+        self.served[self.path] = attempt + 1
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Disposition', 'attachment; filename="{}"'.format(parts[1]))
+        self.send_header('Content-Length', str(size))
+        self.end_headers()
+
+        sent = 0
+        for chunk in file_bytes(size):
+            # Only the first attempt is cut off so retries can succeed
+            if self.drop_after and attempt == 0 and sent >= self.drop_after:
+                self.connection.close()
+                return
+            self.wfile.write(chunk)
+            sent += len(chunk)
+            if self.rate:
+                time.sleep(len(chunk) / self.rate)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--rate-kb', type=int, default=512, help='bandwidth limit per download, 0 for none')
+    parser.add_argument('--drop-after-mb', type=float, default=0, help='drop the first attempt after this many MB')
+    args = parser.parse_args()
+
+    DownloadHandler.rate = args.rate_kb * 1024
+    DownloadHandler.drop_after = int(args.drop_after_mb * 1024 * 1024)
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), DownloadHandler)
+    print("Serving on http://127.0.0.1:{}/file/<size_mb>.bin".format(args.port))
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
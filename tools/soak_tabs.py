@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Tab open/close soak test for Tele Browser
+
+Opens and closes a large number of tabs and checks that the resident
+memory and the number of QtWebEngineProcess children return to the
+baseline measured before the run.
+
+Usage: QT_QPA_PLATFORM=offscreen python3 tools/soak_tabs.py [cycles]
+"""
+
+import os
+import sys
+import psutil
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QUrl, QTimer
+from PyQt5.QtWidgets import QApplication
+
+CYCLES = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+TABS_PER_CYCLE = 5
+SETTLE_MS = 5000
+RSS_TOLERANCE_MB = 64
+SOAK_URL = QUrl('data:text/html,<html><body><h1>soak</h1></body></html>')
+
+
+def snapshot():
+    """Total RSS (MB) of this process and its children, and child count"""
+    me = psutil.Process()
+    children = me.children(recursive=True)
+    rss = me.memory_info().rss
+    for child in children:
+        try:
+            rss += child.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return rss / (1024 * 1024), len(children)
+
+
+class Soak:
+    def __init__(self, browser):
+        self.browser = browser
+        self.cycle = 0
+        self.baseline = None
+
+    def start(self):
+        self.baseline = snapshot()
+        print("Baseline: {:.1f} MB, {} children".format(*self.baseline))
+        QTimer.singleShot(0, self.step)
+
+    def step(self):
+        if self.cycle >= CYCLES:
+            QTimer.singleShot(SETTLE_MS, self.finish)
+            return
+
+        tabs = self.browser.tabs
+        for _ in range(TABS_PER_CYCLE):
+            self.browser.add_new_tab(SOAK_URL, 'Soak')
+        while tabs.count() > 1:
+            self.browser.close_tab(tabs.count() - 1)
+
+        self.cycle += 1
+        if self.cycle % 50 == 0:
+            print("Cycle {}: {:.1f} MB, {} children".format(self.cycle, *snapshot()))
+        QTimer.singleShot(50, self.step)
+
+    def finish(self):
+        rss, children = snapshot()
+        base_rss, base_children = self.baseline
+        print("Final: {:.1f} MB, {} children".format(rss, children))
+
+        failed = False
+        if children > base_children:
+            print("FAIL: {} renderer processes leaked".format(children - base_children))
+            failed = True
+        if rss - base_rss > RSS_TOLERANCE_MB:
+            print("FAIL: RSS grew by {:.1f} MB".format(rss - base_rss))
+            failed = True
+        if not failed:
+            print("PASS: {} tabs opened and closed".format(CYCLES * TABS_PER_CYCLE))
+
+        self.browser.is_closing = True
+        QApplication.instance().exit(1 if failed else 0)
+
+
+def main():
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    # QtWebEngineWidgets (pulled in by secure_browser) must be imported
+    # before the QApplication is created
+    from secure_browser import TeleBrowser
+    app = QApplication(sys.argv)
+
+    browser = TeleBrowser()
+    browser.show()
+
+    soak = Soak(browser)
+    # Let the staged startup finish and the home tab's renderer start
+    # before taking the baseline
+    browser.startup.finished.connect(lambda: QTimer.singleShot(SETTLE_MS, soak.start))
+    sys.exit(app.exec_())
+
+
+if __name__ == '__main__':
+    main()